@@ -1,4 +1,5 @@
 import uilib as ui
+import asyncio
 import plotly.express as px
 
 
@@ -22,24 +23,35 @@ controls_col.header("Controls")
 plot_container = ui.Container()
 plot_col.add(plot_container)
 
-# --- 5. Define the callback function ---
-# This function will be called whenever the dropdown selection changes.
-def update_plot(select_component, event):
-    """Clears the plot container and draws a new plot based on the selection."""
-    dataset_name = select_component.get_value()
-
+# --- 5. Define the callback functions ---
+# build_plot is memoized with ui.memo, so switching back to a dataset that has
+# already been shown reattaches the existing plot instead of rebuilding it.
+# The datasets are loaded with ui.load_dataframe, which keeps them in memory and
+# in the browser's storage, so reloading the page skips reloading them.
+@ui.memo(maxsize=3)
+async def build_plot(dataset_name):
+    """Builds a container holding the plot for a dataset."""
     if dataset_name == "iris":
-        df = px.data.iris()
+        df = await ui.load_dataframe("iris", px.data.iris)
         fig = px.scatter(df, x="sepal_width", y="sepal_length", color="species", title="Iris Dataset")
     elif dataset_name == "gapminder":
-        df = px.data.gapminder().query("continent=='Oceania'")
+        df = (await ui.load_dataframe("gapminder", px.data.gapminder)).query("continent=='Oceania'")
         fig = px.line(df, x="year", y="lifeExp", color="country", title="Gapminder (Oceania)")
     else: # Default to "tips"
-        df = px.data.tips()
+        df = await ui.load_dataframe("tips", px.data.tips)
         fig = px.scatter(df, x="total_bill", y="tip", color="smoker", title="Tips Dataset")
 
-    # Clear the old plot and display the new one
-    plot_container.clear().disp(fig)
+    # Attach the new container before drawing, so the plot is sized to fit it
+    plot = ui.Container()
+    plot_container.clear().add(plot)
+    plot.disp(fig)
+    return plot
+
+# This function will be called whenever the dropdown selection changes.
+async def update_plot(select_component, event):
+    """Shows the plot for the selected dataset in the plot container."""
+    plot = await build_plot(select_component.get_value())
+    plot_container.clear().add(plot)
 
 # --- 6. Create and configure the dropdown ---
 dataset_select = ui.Select(
@@ -51,4 +63,4 @@ dataset_select = ui.Select(
 controls_col.add(dataset_select)
 
 # --- 7. Trigger the initial plot draw ---
-update_plot(dataset_select, None)
\ No newline at end of file
+asyncio.ensure_future(update_plot(dataset_select, None))
\ No newline at end of file
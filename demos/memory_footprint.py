@@ -0,0 +1,47 @@
+import uilib as ui
+import tracemalloc
+
+# Measures the Python-side memory used by each component class.
+# Each class is instantiated many times while tracemalloc records allocations;
+# the difference divided by the count is the per-component cost. The components
+# are never attached to the page, so only their Python footprint is measured.
+
+COUNT = 1000
+
+factories = {
+    "Button": lambda: ui.Button("Button"),
+    "Select": lambda: ui.Select(caption="Select", values=[1, 2, 3]),
+    "TextInput": lambda: ui.TextInput(caption="Text"),
+    "TextArea": lambda: ui.TextArea(caption="Text"),
+    "Checkbox": lambda: ui.Checkbox(label="Check"),
+    "Slider": lambda: ui.Slider(caption="Slider"),
+    "RadioGroup": lambda: ui.RadioGroup(caption="Radio", values=["A", "B", "C"]),
+    "Alert": lambda: ui.Alert("Alert"),
+    "SmallBanner": lambda: ui.SmallBanner("Banner"),
+    "Container": lambda: ui.Container(),
+}
+
+page = ui.Page(titletext="Component memory footprint")
+page.add(ui.Banner("Component memory footprint", f"Python memory per component, averaged over {COUNT} instances"))
+results = ui.Container()
+page.add(results)
+
+rows = []
+tracemalloc.start()
+for name, factory in factories.items():
+    before = tracemalloc.take_snapshot()
+    components = [factory() for _ in range(COUNT)]
+    after = tracemalloc.take_snapshot()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    rows.append(f"<tr><td>{name}</td><td class='text-end'>{total // COUNT:,}</td></tr>")
+    # Release the components so each measurement starts from the same baseline.
+    for c in components:
+        ui._component_registry.pop(c.id, None)
+    del components
+tracemalloc.stop()
+
+results.writeMarkdown(
+    "<table class='table table-sm'><thead><tr><th>Component</th><th class='text-end'>Bytes per instance</th></tr></thead>"
+    f"<tbody>{''.join(rows)}</tbody></table>",
+    append=False,
+)
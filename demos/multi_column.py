@@ -1,4 +1,5 @@
-from uilib import Page, Banner, Row, Container, TextInput, Select, Button, Alert, SmallBanner
+from uilib import Page, Banner, Row, Container, TextInput, Select, Button, Alert, SmallBanner, DataSource, KPITile
+import numpy as np
 import plotly.express as px
 from pyscript import display
 
@@ -8,18 +9,25 @@ page.add(Banner(title="Sales Dashboard", subtitle="Real-time Metrics & Insights"
 
 # --- Summary Row ---
 summary_row = Row(layout=[4, 4, 4])
-summary_row.columns[0].add(SmallBanner("📈 Revenue: $12,450"))
-summary_row.columns[1].add(SmallBanner("🛒 Orders: 235"))
+# The revenue tile shows a sparkline of cumulative revenue; updating it only
+# replaces the line's path and the value text.
+revenue_tile = KPITile("📈 Revenue", 0, values=[], fmt="${:,.0f}")
+orders_tile = KPITile("🛒 Orders", 0)
+summary_row.columns[0].add(revenue_tile)
+summary_row.columns[1].add(orders_tile)
 summary_row.columns[2].add(SmallBanner("👥 Customers: 89"))
 page.add(summary_row)
 
 # --- Data Storage ---
-sales_data = {
-    "North": 1000,
-    "South": 1500,
-    "East": 800,
-    "West": 1200
-}
+# Each record is a row in a DataSource. The per-region totals are maintained
+# incrementally as records are added, rather than recomputed from every row.
+regions = ["North", "South", "East", "West"]
+sales_data = DataSource({
+    "product": ["Opening balance"] * 4,
+    "region": regions,
+    "sales": [1000, 1500, 800, 1200],
+})
+sales_by_region = sales_data.add_aggregate("by_region", by="region", column="sales", func="sum")
 
 # --- Form Row ---
 form_row = Row(layout=[6, 6])
@@ -28,7 +36,7 @@ result_container = form_row.columns[1]
 page.add(form_row)
 
 product_input = TextInput(caption="Product Name", placeholder="e.g., Widget X")
-region_select = Select(caption="Region", values=list(sales_data.keys()))
+region_select = Select(caption="Region", values=regions)
 sales_input = TextInput(caption="Sales Amount", placeholder="e.g., 1000")
 
 form_container.add(product_input)
@@ -42,8 +50,8 @@ page.add(chart_container)
 # --- Chart Drawing Function ---
 def draw_chart():
     chart_container.clear()
-    regions = list(sales_data.keys())
-    values = list(sales_data.values())
+    totals = sales_by_region.result
+    values = [totals.get(region, 0) for region in regions]
     
     fig = px.bar(
         x=regions,
@@ -57,7 +65,21 @@ def draw_chart():
     
     chart_container.disp(fig, append=False)
 
+# --- Summary Tiles ---
+def update_summary():
+    revenue_tile.update(sum(sales_by_region.result.values()), np.cumsum(sales_data["sales"]))
+    orders_tile.set_value(len(sales_data))
+
+# Redraw whenever records are added; the delta says which region totals changed.
+def on_sales_changed(source, delta):
+    if delta.aggregates.get("by_region"):
+        update_summary()
+        draw_chart()
+
+sales_data.bind(on_sales_changed)
+
 # --- Initial Chart ---
+update_summary()
 draw_chart()
 
 # --- Submit Callback ---
@@ -69,13 +91,12 @@ def submit_data(component, event):
     result_container.clear()
     if product and region and sales.isdigit():
         sale_value = int(sales)
-        sales_data[region] = sales_data.get(region, 0) + sale_value
         
         msg = f"**Product:** {product}<br>**Region:** {region}<br>**Sales Added:** ${sale_value}"
         alert = Alert(text=msg, category="success", dismissible=True)
         result_container.add(alert)
 
-        draw_chart()
+        sales_data.append({"product": product, "region": region, "sales": sale_value})
     else:
         alert = Alert(text="Please complete all fields correctly.", category="danger", dismissible=True)
         result_container.add(alert)
@@ -0,0 +1,44 @@
+import json
+import time
+from pyscript import window
+
+# Measures cold-start cost so that regressions can be tracked.
+# performance.now() counts from the start of navigation, so the first reading
+# covers loading PyScript, Pyodide and the packages in pyscript.toml.
+# Open this page in a fresh tab (or with the cache disabled) for cold numbers.
+
+python_ready_ms = window.performance.now()
+
+start = time.perf_counter()
+import uilib as ui
+import_ms = (time.perf_counter() - start) * 1000
+
+start = time.perf_counter()
+page = ui.Page(titletext="Startup benchmark")
+page.add(ui.Banner("Startup benchmark", "Time to a first uilib Page"))
+first_page_ms = (time.perf_counter() - start) * 1000
+first_page_total_ms = window.performance.now()
+
+# The optional submodules are imported on first use; measure them separately.
+start = time.perf_counter()
+ui.DataSource
+ui.TimeSeriesChart
+optional_import_ms = (time.perf_counter() - start) * 1000
+
+results = {
+    "python_ready_ms": round(python_ready_ms, 1),
+    "import_uilib_ms": round(import_ms, 1),
+    "first_page_ms": round(first_page_ms, 1),
+    "first_page_total_ms": round(first_page_total_ms, 1),
+    "import_optional_ms": round(optional_import_ms, 1),
+}
+
+rows = "".join(f"<tr><td>{name}</td><td class='text-end'>{value:,.1f}</td></tr>" for name, value in results.items())
+page.writeMarkdown(
+    "<table class='table table-sm'><thead><tr><th>Measurement</th><th class='text-end'>ms</th></tr></thead>"
+    f"<tbody>{rows}</tbody></table>"
+)
+page.writeMarkdown("Results are also printed to the browser console as JSON.")
+
+# One JSON line per run, easy to collect from the console or a headless browser.
+print("uilib-startup " + json.dumps(results))
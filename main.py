@@ -158,14 +158,16 @@ def show_programmatic_access():
     prog_col1.add(update_button)
 
 # --- Main Application Flow ---
-show_matplotlib_integration()
-page.writeMarkdown("---")
-show_headers_and_text()
-page.writeMarkdown("---")
-show_interactive_controls()
-page.writeMarkdown("---")
-show_alerts()
-page.writeMarkdown("---")
-show_custom_rows()
-page.writeMarkdown("---")
-show_programmatic_access()
+# Each section is built in its own time slice, so the first sections appear
+# (and respond to input) while the rest of the page is still being built.
+def separator():
+    page.writeMarkdown("---")
+
+page.add_many([
+    show_matplotlib_integration, separator,
+    show_headers_and_text, separator,
+    show_interactive_controls, separator,
+    show_alerts, separator,
+    show_custom_rows, separator,
+    show_programmatic_access,
+], budget_ms=12)
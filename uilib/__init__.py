@@ -0,0 +1,1437 @@
+# uilib.py - A Pythonic UI library for PyScript
+#
+# This library provides a set of classes to build user interfaces
+# in a more structured and object-oriented way than direct DOM manipulation.
+# It is designed to work with Bootstrap 5 for styling.
+#
+# ---
+#
+# MIT License
+#
+# Copyright (c) 2025 Alan Jones
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT- LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+from pyscript import document
+from pyscript import display
+from pyscript import window
+from pyodide.ffi import create_proxy, to_js
+from collections import OrderedDict, deque
+import asyncio
+import functools
+import inspect
+import itertools
+import json
+import re
+import time
+from typing import Any, Callable, Iterable, List, Optional, Union
+import markdown as md
+
+# The static ID for the main page container.
+PAGEID = "pui-id-page"
+# This registry is crucial to prevent Python from garbage-collecting component
+# objects that are only referenced by JavaScript event listeners.
+_component_registry = {}
+# Proxies owned by each component, keyed by component id, destroyed by Component.dispose().
+_component_proxies = {}
+# The active EventRecorder, if any, and the tasks started by callbacks during a replay.
+_recorder = None
+_replay_tasks = None
+# Source of component ids. A counter never reuses an id, even after a component is discarded.
+_id_counter = itertools.count(1)
+# Prototype DOM subtrees, keyed by component class and configuration. Uniform
+# components are created by cloning a prototype, which takes far fewer DOM calls
+# than building each one element by element.
+_prototypes = {}
+
+# Counts of proxies created and destroyed by uilib, reported by memory_report().
+_proxy_counts = {"created": 0, "destroyed": 0}
+
+def _create_proxy(obj: Any) -> Any:
+    """Wraps pyodide's create_proxy, counting proxies so that leaks show up in memory_report()."""
+    _proxy_counts["created"] += 1
+    return create_proxy(obj)
+
+def _destroy_proxy(proxy: Any) -> None:
+    """Destroys a proxy made by _create_proxy."""
+    _proxy_counts["destroyed"] += 1
+    proxy.destroy()
+
+async def _next_frame() -> None:
+    """Waits until the browser has had a chance to render, i.e. the next animation frame."""
+    if document.visibilityState != "visible":
+        await asyncio.sleep(0) # Animation frames are paused in background tabs
+        return
+    future = asyncio.get_event_loop().create_future()
+    def on_frame(timestamp):
+        if not future.done():
+            future.set_result(None)
+        _destroy_proxy(proxy)
+    proxy = _create_proxy(on_frame)
+    window.requestAnimationFrame(proxy)
+    await future
+
+def _clone_prototype(key: tuple, build: Callable[[], Any]) -> Any:
+    """Returns a deep copy of the prototype subtree for `key`, building the prototype on first use."""
+    prototype = _prototypes.get(key)
+    if prototype is None:
+        prototype = _prototypes[key] = build()
+    return prototype.cloneNode(True)
+
+# Component Base Class (New)
+class Component:
+    """A base class for all UI components, providing common functionality."""
+    # Slots keep each instance small; pages can hold many thousands of components.
+    # Subclasses should declare their own __slots__ for any attributes they add.
+    __slots__ = ("id", "node", "__weakref__")
+
+    def __init__(self, tag: str = "div", node: Any = None):
+        self.id = f"pui-id-{next(_id_counter)}" # Unique for the lifetime of the page, unlike id(self)
+        self.node = node if node is not None else document.createElement(tag)
+        self.node.setAttribute("id", self.id)
+        # Marks the node as a component root even if its id is changed later (e.g. Modal's modal_id).
+        self.node.setAttribute("data-pui", self.id)
+        _component_registry[self.id] = self # Prevent garbage collection
+
+    def add_to(self, parent_node: Any) -> None:
+        """Appends the component's node to a parent DOM node."""
+        parent_node.append(self.node)
+
+    def set_class(self, class_string: str) -> None:
+        """Sets the CSS class attribute for the component's node."""
+        self.node.setAttribute("class", class_string)
+
+    def _proxy_event_handler(self, callback: Callable) -> Callable:
+        """Creates a proxy to a Python callback that receives the component instance."""
+        def wrapper(event):
+            if _recorder is not None:
+                _recorder._record(self, event)
+            # 'self' is the component instance, captured by the closure.
+            # The user's callback receives the component and the event.
+            result = callback(self, event)
+            if inspect.isawaitable(result):
+                # Async callbacks are scheduled rather than silently dropped.
+                task = asyncio.ensure_future(result)
+                if _replay_tasks is not None:
+                    _replay_tasks.append(task) # So replay_events() can wait for it
+        # create_proxy is essential to pass a Python function to a JS event listener
+        return self._own_proxy(_create_proxy(wrapper))
+
+    def _own_proxy(self, proxy: Any) -> Any:
+        """Records a proxy as belonging to this component, so that dispose() destroys it. Returns the proxy."""
+        _component_proxies.setdefault(self.id, []).append(proxy)
+        return proxy
+
+    def dispose(self) -> None:
+        """
+        Removes the component, and any components inside it, from the page and releases them.
+
+        Their event listener proxies are destroyed and they are dropped from the
+        registry, so they can be garbage-collected. A disposed component must not be used again.
+        """
+        ids = [self.id] + [elem.getAttribute("data-pui") for elem in self.node.querySelectorAll("[data-pui]")]
+        for component_id in ids:
+            for proxy in _component_proxies.pop(component_id, ()):
+                _destroy_proxy(proxy)
+            _component_registry.pop(component_id, None)
+        self.node.remove()
+
+# UI Component Classes (New)
+class Button(Component):
+    """Creates an interactive button element."""
+    __slots__ = ()
+    def __init__(self, caption: str = "Button", callback: Optional[Callable] = None, value: str = "pressed", btnClass: str = "btn btn-primary"):
+        """
+        Args:
+            caption (str, optional): The text displayed on the button. Defaults to "Button".
+            callback (Callable, optional): The Python function to call when the button is clicked. Defaults to None.
+            value (str, optional): The value attribute of the button. Defaults to "pressed".
+            btnClass (str, optional): The CSS class(es) for styling. Defaults to "btn btn-primary".
+        """
+        super().__init__(tag="button")
+        if callback:
+            self.node.addEventListener("click", self._proxy_event_handler(callback))
+        self.set_class(btnClass)
+        self.node.setAttribute("type", "button")
+        self.node.setAttribute("value", value)
+        self.node.append(document.createTextNode(caption))
+
+    def get_value(self) -> str:
+        """Returns the value attribute of the button."""
+        return self.node.value
+
+    def set_value(self, value: str) -> None:
+        """Sets the value attribute of the button."""
+        self.node.value = value
+        
+
+
+class Select(Component):
+    """Creates a dropdown selection menu."""
+    __slots__ = ("select_elem",)
+    def __init__(self, caption: str = "", callback: Optional[Callable] = None, values: List[Any] = [], labels: List[str] = []):
+        """
+        Args:
+            caption (str, optional): A label displayed above the select menu. Defaults to "".
+            callback (Callable, optional): The Python function to call when the selection changes. Defaults to None.
+            values (List[Any], optional): The list of values for the options. Defaults to [].
+            labels (List[str], optional): The list of display labels for the options. If empty, `values` will be used. Defaults to [].
+        """
+        super().__init__(tag="div")
+        self.set_class("mb-3") # Good default styling for Bootstrap
+
+        select_id = f"{self.id}-select" # Derive sub-element ID from component ID
+        if not labels:
+            labels = values
+
+        if caption:
+            label_elem = document.createElement("label")
+            label_elem.setAttribute("for", select_id)
+            label_elem.setAttribute("class", "form-label")
+            label_elem.append(document.createTextNode(caption))
+            self.node.append(label_elem)
+
+        self.select_elem = document.createElement("select")
+        if callback:
+            self.select_elem.addEventListener("change", self._proxy_event_handler(callback))
+        self.select_elem.setAttribute("class", "form-select")
+        self.select_elem.setAttribute("id", select_id)
+
+        for l, v in zip(labels, values):
+            option_elem = document.createElement("option")
+            option_elem.setAttribute("value", str(v))
+            option_elem.append(document.createTextNode(str(l)))
+            self.select_elem.append(option_elem)
+
+        self.node.append(self.select_elem)
+
+    def get_value(self) -> str:
+        """Returns the value of the currently selected option."""
+        return self.select_elem.value
+
+    def set_value(self, value: Any) -> None:
+        """Sets the selected option based on its value."""
+        self.select_elem.value = str(value)
+
+class TextInput(Component):
+    """Creates a single-line text input field."""
+    __slots__ = ("input_elem",)
+    def __init__(self, caption: str = "", initial_value: str = "", placeholder: str = "", callback: Optional[Callable] = None):
+        """
+        Args:
+            caption (str, optional): A label displayed above the input field. Defaults to "".
+            initial_value (str, optional): The starting value in the input field. Defaults to "".
+            placeholder (str, optional): Placeholder text to display when the field is empty. Defaults to "".
+            callback (Callable, optional): The Python function to call on each keystroke (`input` event). Defaults to None.
+        """
+        has_caption = bool(caption)
+        super().__init__(node=_clone_prototype(("TextInput", has_caption), lambda: self._prototype(has_caption)))
+
+        input_id = f"{self.id}-input"
+
+        if caption:
+            label_elem = self.node.firstElementChild
+            label_elem.setAttribute("for", input_id)
+            label_elem.textContent = caption
+
+        self.input_elem = self.node.lastElementChild
+        self.input_elem.setAttribute("id", input_id)
+        if initial_value: self.input_elem.setAttribute("value", initial_value)
+        if placeholder: self.input_elem.setAttribute("placeholder", placeholder)
+        if callback: self.input_elem.addEventListener("change", self._proxy_event_handler(callback))
+
+    @staticmethod
+    def _prototype(has_caption: bool) -> Any:
+        """Builds the DOM subtree that TextInput instances are cloned from."""
+        node = document.createElement("div")
+        node.setAttribute("class", "mb-3") # Bootstrap margin-bottom
+        if has_caption:
+            label_elem = document.createElement("label")
+            label_elem.setAttribute("class", "form-label")
+            node.append(label_elem)
+        input_elem = document.createElement("input")
+        input_elem.setAttribute("type", "text")
+        input_elem.setAttribute("class", "form-control")
+        input_elem.setAttribute("value", "")
+        node.append(input_elem)
+        return node
+
+    def get_value(self) -> str:
+        """Returns the current value of the input field."""
+        return self.input_elem.value
+
+    def set_value(self, value: str) -> None:
+        """Sets the value of the input field."""
+        self.input_elem.value = value
+
+class TextArea(Component):
+    """Creates a multi-line text input area."""
+    __slots__ = ("textarea_elem",)
+    def __init__(self, caption: str = "", initial_value: str = "", placeholder: str = "", rows: int = 3, callback: Optional[Callable] = None):
+        """
+        Args:
+            caption (str, optional): A label displayed above the text area. Defaults to "".
+            initial_value (str, optional): The starting text in the area. Defaults to "".
+            placeholder (str, optional): Placeholder text to display when the area is empty. Defaults to "".
+            rows (int, optional): The visible number of lines in the text area. Defaults to 3.
+            callback (Callable, optional): The Python function to call on each keystroke (`input` event). Defaults to None.
+        """
+        has_caption = bool(caption)
+        super().__init__(node=_clone_prototype(("TextArea", has_caption), lambda: self._prototype(has_caption)))
+
+        textarea_id = f"{self.id}-textarea"
+
+        if caption:
+            label_elem = self.node.firstElementChild
+            label_elem.setAttribute("for", textarea_id)
+            label_elem.textContent = caption
+
+        self.textarea_elem = self.node.lastElementChild
+        self.textarea_elem.setAttribute("id", textarea_id)
+        if rows != 3:
+            self.textarea_elem.setAttribute("rows", str(rows))
+        if placeholder:
+            self.textarea_elem.setAttribute("placeholder", placeholder)
+        if callback: self.textarea_elem.addEventListener("change", self._proxy_event_handler(callback))
+        if initial_value:
+            self.textarea_elem.textContent = initial_value
+
+    @staticmethod
+    def _prototype(has_caption: bool) -> Any:
+        """Builds the DOM subtree that TextArea instances are cloned from."""
+        node = document.createElement("div")
+        node.setAttribute("class", "mb-3") # Bootstrap margin-bottom
+        if has_caption:
+            label_elem = document.createElement("label")
+            label_elem.setAttribute("class", "form-label")
+            node.append(label_elem)
+        textarea_elem = document.createElement("textarea")
+        textarea_elem.setAttribute("class", "form-control")
+        textarea_elem.setAttribute("rows", "3")
+        node.append(textarea_elem)
+        return node
+
+    def get_value(self) -> str:
+        """Returns the current content of the text area."""
+        return self.textarea_elem.value
+
+    def set_value(self, value: str) -> None:
+        """Sets the content of the text area."""
+        self.textarea_elem.value = value
+
+class Checkbox(Component):
+    """Creates a checkbox input with a label."""
+    __slots__ = ("input_elem",)
+    def __init__(self, label: str = "", callback: Optional[Callable] = None, value: Optional[Any] = None):
+        """
+        Args:
+            label (str, optional): The text label displayed next to the checkbox. Defaults to "".
+            callback (Callable, optional): The Python function to call when the checkbox state changes. Defaults to None.
+            value (Any, optional): The value associated with the checkbox, accessible in the event. Defaults to None.
+        """
+        super().__init__(node=_clone_prototype(("Checkbox",), self._prototype))
+
+        checkbox_id = f"{self.id}-checkbox"
+
+        self.input_elem = self.node.firstElementChild
+        if value is not None:
+            self.input_elem.setAttribute("value", str(value))
+        self.input_elem.setAttribute("id", checkbox_id)
+        if callback:
+            self.input_elem.addEventListener("change", self._proxy_event_handler(callback))
+
+        label_elem = self.node.lastElementChild
+        label_elem.setAttribute("for", checkbox_id)
+        if label:
+            label_elem.textContent = label
+
+    @staticmethod
+    def _prototype() -> Any:
+        """Builds the DOM subtree that Checkbox instances are cloned from."""
+        node = document.createElement("div")
+        node.setAttribute("class", "form-check")
+        input_elem = document.createElement("input")
+        input_elem.setAttribute("class", "form-check-input")
+        input_elem.setAttribute("type", "checkbox")
+        label_elem = document.createElement("label")
+        label_elem.setAttribute("class", "form-check-label")
+        node.append(input_elem)
+        node.append(label_elem)
+        return node
+
+    def is_checked(self) -> bool:
+        """Returns True if the checkbox is checked, False otherwise."""
+        return self.input_elem.checked
+
+    def set_checked(self, checked: bool) -> None:
+        """Sets the checked state of the checkbox."""
+        self.input_elem.checked = bool(checked)
+
+class Slider(Component):
+    """Creates a slider (range input) control."""
+    __slots__ = ("slider_elem",)
+    def __init__(self, caption: str = "", min_val: int = 0, max_val: int = 100, initial_val: Optional[int] = None, step: int = 1, callback: Optional[Callable] = None):
+        """
+        Args:
+            caption (str, optional): A label displayed above the slider. Defaults to "".
+            min_val (int, optional): The minimum value of the slider. Defaults to 0.
+            max_val (int, optional): The maximum value of the slider. Defaults to 100.
+            initial_val (Optional[int], optional): The starting value of the slider. Defaults to `min_val`.
+            step (int, optional): The increment step of the slider. Defaults to 1.
+            callback (Callable, optional): The Python function to call when the slider value changes. Defaults to None.
+        """
+        # Sliders with the same range share a prototype, so only the id and value need patching.
+        key = ("Slider", bool(caption), min_val, max_val, step)
+        super().__init__(node=_clone_prototype(key, lambda: self._prototype(bool(caption), min_val, max_val, step)))
+
+        slider_id = f"{self.id}-slider"
+
+        if caption:
+            label_elem = self.node.firstElementChild
+            label_elem.setAttribute("for", slider_id)
+            label_elem.textContent = caption
+
+        self.slider_elem = self.node.lastElementChild
+        self.slider_elem.setAttribute("id", slider_id)
+        if initial_val is not None and initial_val != min_val:
+            self.slider_elem.setAttribute("value", str(initial_val))
+        if callback: self.slider_elem.addEventListener("change", self._proxy_event_handler(callback))
+
+    @staticmethod
+    def _prototype(has_caption: bool, min_val: int, max_val: int, step: int) -> Any:
+        """Builds the DOM subtree that Slider instances are cloned from."""
+        node = document.createElement("div")
+        node.setAttribute("class", "mb-3")
+        if has_caption:
+            label_elem = document.createElement("label")
+            label_elem.setAttribute("class", "form-label")
+            node.append(label_elem)
+        slider_elem = document.createElement("input")
+        slider_elem.setAttribute("type", "range")
+        slider_elem.setAttribute("class", "form-range")
+        slider_elem.setAttribute("min", str(min_val))
+        slider_elem.setAttribute("max", str(max_val))
+        slider_elem.setAttribute("step", str(step))
+        slider_elem.setAttribute("value", str(min_val))
+        node.append(slider_elem)
+        return node
+
+    def get_value(self) -> str:
+        """Returns the current value of the slider as a string."""
+        return self.slider_elem.value
+
+    def set_value(self, value: Union[int, float, str]) -> None:
+        """Sets the value of the slider."""
+        self.slider_elem.value = str(value)
+
+class RadioGroup(Component):
+    """Creates a group of radio buttons where only one can be selected."""
+    __slots__ = ()
+    def __init__(self, caption: str = "", callback: Optional[Callable] = None, values: List[Any] = [], labels: List[str] = [], initial_value: Optional[Any] = None):
+        """
+        Args:
+            caption (str, optional): A label for the entire radio group. Defaults to "".
+            callback (Callable, optional): The Python function to call when the selection changes. Defaults to None.
+            values (List[Any], optional): The list of values for the radio options. Defaults to [].
+            labels (List[str], optional): The list of display labels for the options. If empty, `values` will be used. Defaults to [].
+            initial_value (Optional[Any], optional): The value of the radio button to be selected initially. Defaults to None.
+        """
+        super().__init__(tag="fieldset")
+        self.set_class("mb-3")
+
+        if caption:
+            legend_elem = document.createElement("legend")
+            legend_elem.setAttribute("class", "col-form-label pt-0")
+            legend_elem.append(document.createTextNode(caption))
+            self.node.append(legend_elem)
+
+        if not labels:
+            labels = values
+
+        for l, v in zip(labels, values):
+            wrapper_div = document.createElement("div")
+            wrapper_div.setAttribute("class", "form-check")
+
+            radio_id = f"{self.id}-radio-{v}"
+            input_elem = document.createElement("input")
+            input_elem.setAttribute("class", "form-check-input")
+            input_elem.setAttribute("type", "radio")
+            input_elem.setAttribute("name", self.group_name)
+            input_elem.setAttribute("id", radio_id)
+            input_elem.setAttribute("value", str(v))
+            if str(v) == str(initial_value):
+                input_elem.setAttribute("checked", True)
+            if callback:
+                input_elem.addEventListener("change", self._proxy_event_handler(callback))
+
+            label_elem = document.createElement("label")
+            label_elem.setAttribute("class", "form-check-label")
+            label_elem.setAttribute("for", radio_id)
+            label_elem.append(document.createTextNode(str(l)))
+
+            wrapper_div.append(input_elem)
+            wrapper_div.append(label_elem)
+            self.node.append(wrapper_div)
+
+    @property
+    def group_name(self) -> str:
+        """The 'name' attribute shared by all radio buttons in the group."""
+        return f"{self.id}-radiogroup"
+
+    def get_value(self) -> Optional[str]:
+        """Returns the value of the selected radio button, or None if none are selected."""
+        checked_node = self.node.querySelector(f'input[name="{self.group_name}"]:checked')
+        if checked_node:
+            return checked_node.value
+        return None
+
+    def set_value(self, value: Any) -> None:
+        """Selects the radio button corresponding to the given value."""
+        node_to_check = self.node.querySelector(f'input[name="{self.group_name}"][value="{str(value)}"]')
+        if node_to_check:
+            node_to_check.checked = True
+
+class Alert(Component):
+    """Creates a contextual feedback message box."""
+    __slots__ = ()
+    def __init__(self, text: str = "", category: str = "primary", dismissible: bool = False):
+        """
+        Args:
+            text (str, optional): The message to display in the alert. Can contain markdown/HTML. Defaults to "".
+            category (str, optional): The alert category, controlling the color (e.g., 'primary', 'success', 'danger'). Defaults to "primary".
+            dismissible (bool, optional): If True, adds a close button to the alert. Defaults to False.
+        """
+        super().__init__(tag="div")
+
+        class_list = f"alert alert-{category}"
+        if dismissible:
+            class_list += " alert-dismissible fade show"
+
+        self.set_class(class_list)
+        self.node.setAttribute("role", "alert")
+
+        # Use a temporary node to parse potential markdown/html in the text
+        content_node = document.createElement("span")
+        content_node.innerHTML = md.markdown(text)
+        for child in list(content_node.childNodes):
+            self.node.append(child)
+
+        if dismissible:
+            button = document.createElement("button")
+            button.setAttribute("type", "button")
+            button.setAttribute("class", "btn-close")
+            button.setAttribute("data-bs-dismiss", "alert")
+            button.setAttribute("aria-label", "Close")
+            self.node.append(button)
+
+class Banner(Component):
+    """Creates a large, prominent banner with a title and subtitle."""
+    __slots__ = ()
+    def __init__(self, title: str = "", subtitle: str = ""):
+        """
+        Args:
+            title (str, optional): The main text of the banner. Defaults to "".
+            subtitle (str, optional): The smaller text below the main title. Defaults to "".
+        """
+        super().__init__(tag="div")
+        self.set_class("bg-primary text-center text-white p-2 my-2")
+
+        title_elem = document.createElement("div")
+        title_elem.setAttribute("class", "display-3")
+        title_elem.append(document.createTextNode(title))
+        self.node.append(title_elem)
+
+        if subtitle:
+            subtitle_elem = document.createElement("div")
+            subtitle_elem.setAttribute("class", "lead")
+            subtitle_elem.append(document.createTextNode(subtitle))
+            self.node.append(subtitle_elem)
+
+class SmallBanner(Component):
+    """Creates a smaller, more compact banner."""
+    __slots__ = ()
+    def __init__(self, text: str = ""):
+        """
+        Args:
+            text (str, optional): The text to display in the banner. Defaults to "".
+        """
+        super().__init__(tag="div")
+        self.set_class("bg-primary text-center text-white p-2 my-1")
+
+        title_elem = document.createElement("div")
+        title_elem.setAttribute("class", "display-4")
+        title_elem.append(document.createTextNode(text))
+        self.node.append(title_elem)
+
+    def set_text(self, text: str) -> None:
+        """Replaces the text of the banner."""
+        self.node.firstElementChild.textContent = text
+
+
+
+class Container(Component):
+    """A generic container component that acts as a <div> element."""
+    __slots__ = ()
+    def __init__(self, class_name: Optional[str] = None):
+        """
+        Initializes a generic container (a <div> element).
+
+        Args:
+            class_name (str, optional): The CSS class(es) to apply to the container. Defaults to None.
+        """
+        super().__init__(tag="div")
+        if class_name:
+            self.set_class(class_name)
+
+    def add(self, component: 'Component') -> 'Container':
+        """Adds a component object to this container and returns self for chaining."""
+        component.add_to(self.node)
+        return self # Return self to allow for method chaining
+
+    def add_many(self, items: Iterable[Union['Component', Callable]], budget_ms: Optional[float] = None) -> Any:
+        """
+        Adds many components, optionally in time slices so that the browser stays responsive.
+
+        `items` may be any iterable, including a generator that builds components
+        as it goes. Callables in `items` are called with no arguments, which suits
+        functions that build a section of the page themselves.
+
+        Args:
+            items (Iterable[Union[Component, Callable]]): The components to add, or functions to call, in order.
+            budget_ms (float, optional): If given, work is done in slices of about this many milliseconds, yielding to the browser between slices so content appears early and input is handled. Defaults to None, which adds everything at once.
+
+        Returns:
+            Union[Container, asyncio.Task]: self when `budget_ms` is None, otherwise a task that completes when everything is added.
+        """
+        if budget_ms is None:
+            self._add_slice(iter(items), None)
+            return self
+        return asyncio.ensure_future(self._add_sliced(iter(items), budget_ms / 1000))
+
+    async def _add_sliced(self, items: Any, budget_s: float) -> 'Container':
+        while self._add_slice(items, budget_s):
+            await _next_frame() # Let the browser paint and handle input
+        return self
+
+    def _add_slice(self, items: Any, budget_s: Optional[float]) -> bool:
+        """Adds items until the budget is used up. Returns True if there are items left."""
+        # Components are collected in a fragment so each slice costs one DOM insertion.
+        fragment = document.createDocumentFragment()
+        deadline = None if budget_s is None else time.perf_counter() + budget_s
+        more = True
+        for item in items:
+            if isinstance(item, Component):
+                item.add_to(fragment)
+            else:
+                self.node.append(fragment) # Keep the page in order before the function adds to it
+                item()
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        else:
+            more = False
+        self.node.append(fragment)
+        return more
+
+    def clear(self) -> 'Container':
+        """Removes all child elements from this container."""
+        self.node.innerHTML = ""
+        return self # Return self for chaining
+    
+    # Content functions 
+
+    def disp(self, content: Any, append: bool = True) -> None:
+        """Displays content within this container using pyscript.display."""
+        if type(content).__module__.startswith("plotly.") and hasattr(content, "to_plotly_json"):
+            # Plotly figures are drawn directly, sending their arrays in binary rather than as JSON text.
+            from .charts import show_plotly
+            show_plotly(self.node, content, append)
+            return
+        display(content, target=self.id, append=append)
+    def write(self, text: str, append: bool = True) -> None:
+        """Writes plain text to this container."""
+        self.disp(text, append)
+    def writeMarkdown(self, text: str, append: bool = True) -> None:
+        """Writes a string of markdown (which can include HTML) to this container."""
+        if append:
+            # To avoid destroying existing elements (like plots or elements with listeners),
+            # we create a temporary container, add the new HTML to it, and then
+            # append its children to the actual node. This is non-destructive.
+            temp_container = document.createElement("div")
+            temp_container.innerHTML = md.markdown(text)
+            # Use list() to create a static copy of childNodes, as it's a live NodeList
+            for child in list(temp_container.childNodes):
+                self.node.append(child)
+        else:
+            # This is destructive, which is the intended behavior for append=False
+            self.node.innerHTML = md.markdown(text)
+    def headertag(self, text: str, level: int) -> None:
+        """Creates a header tag of a specific level (1-6)."""
+        self.writeMarkdown(f"<h{level}>{text}</h{level}>")
+    def title(self, text: str) -> None:
+        """Creates a main title (<h1>)."""
+        self.headertag(text,1)
+    def header(self, text: str) -> None:
+        """Creates a secondary header (<h2>)."""
+        self.headertag(text,2)
+    def subheader(self, text: str) -> None:
+        """Creates a subheader (<h3>)."""
+        self.headertag(text,3)
+
+                                            
+class Row(Container):
+    """A specialized container that represents a Bootstrap row, which holds columns."""
+    __slots__ = ("columns",)
+    def __init__(self, layout: Union[int, List[int]] = 1):
+        """
+        Args:
+            layout (Union[int, List[int]], optional): 
+                - If an int, creates that many equal-width columns.
+                - If a List[int], creates columns with the specified Bootstrap widths (should sum to 12).
+                Defaults to 1.
+        """
+        super().__init__(class_name="row")
+        self.columns: List['Container'] = []
+        if isinstance(layout, int):
+            for _ in range(layout):
+                col = Container(class_name="col")
+                self.add(col)
+                self.columns.append(col)
+        elif isinstance(layout, list):
+            if sum(layout) != 12:
+                print(f"Warning: uilib.Row column widths {layout} do not sum to 12. Layout may be unexpected.")
+            for width in layout:
+                col = Container(class_name=f"col-{width}")
+                self.add(col)
+                self.columns.append(col)
+
+class Page(Container):
+    """A special singleton container that represents the main page content area and attaches to the DOM."""
+    __slots__ = ()
+    def __init__(self, titletext: str = "", width: str = "narrow"):
+        """
+        Initializes the main page container. This class is a singleton; subsequent
+        calls will adopt the existing page element.
+
+        Args:
+            titletext (str, optional): The text to set as the document's <title>. Defaults to "".
+            width (str, optional): If "narrow", applies the Bootstrap 'container' class for a centered, max-width layout. Defaults to "narrow".
+        """
+        page_node = document.getElementById(PAGEID)
+
+        if page_node:
+            # If it exists, we can't call an __init__ that creates a new node.
+            # We just need to adopt the existing node.
+            self.node = page_node
+            self.id = PAGEID
+        else:
+            # Node doesn't exist, so we create it by calling the parent constructor.
+            super().__init__(class_name="container" if width == "narrow" else None)
+            self.id = PAGEID
+            self.node.setAttribute("id", self.id)
+            
+            # Append to the body, which is the special behavior of Page.
+            bodyNode = document.getElementsByTagName("body")[0]
+            bodyNode.append(self.node)
+
+        # Set the document title. This is safe to run multiple times.
+        headNode = document.getElementsByTagName("head")[0]
+        titletag = headNode.querySelector("title")
+        if not titletag:
+            titletag = document.createElement("title")
+            headNode.append(titletag)
+        titletag.innerHTML = titletext
+
+    def snapshot(self, name: str = "default", outputs: List['Container'] = []) -> None:
+        """
+        Saves the values of all input components (and optionally rendered output) to localStorage.
+
+        Inputs are identified by their class and creation order, so the page must be
+        built in the same order when the snapshot is restored.
+
+        Args:
+            name (str, optional): The name of the snapshot, allowing several per page. Defaults to "default".
+            outputs (List[Container], optional): Containers whose rendered HTML should also be saved. Defaults to [].
+        """
+        state = {
+            "inputs": {key: _get_input_state(c) for key, c in _input_components()},
+            "outputs": {str(i): c.node.innerHTML for i, c in enumerate(outputs)},
+        }
+        window.localStorage.setItem(self._snapshot_key(name), json.dumps(state))
+
+    def restore(self, name: str = "default", outputs: List['Container'] = [], on_restored: Optional[Callable] = None) -> bool:
+        """
+        Restores input values (and optionally rendered output) saved by `snapshot`.
+
+        Values are set directly, so no component callbacks fire while restoring.
+        Instead, `on_restored` is called once at the end to run any dependent
+        computations with the final values.
+
+        Args:
+            name (str, optional): The name of the snapshot. Defaults to "default".
+            outputs (List[Container], optional): Containers to restore rendered HTML into, in the same order as passed to `snapshot`. Defaults to [].
+            on_restored (Callable, optional): A function called with no arguments once everything is restored. Defaults to None.
+
+        Returns:
+            bool: True if a snapshot was found and restored, False otherwise.
+        """
+        saved = window.localStorage.getItem(self._snapshot_key(name))
+        if not saved:
+            return False
+        state = json.loads(saved)
+        inputs = state.get("inputs", {})
+        for key, c in _input_components():
+            if key in inputs:
+                _set_input_state(c, inputs[key])
+        for i, c in enumerate(outputs):
+            html = state.get("outputs", {}).get(str(i))
+            if html is not None:
+                c.node.innerHTML = html
+                # The saved HTML is static and its component ids belong to the previous
+                # session; ids are reissued from 1 on each load, so they would clash.
+                for elem in c.node.querySelectorAll("[id^='pui-id-']"):
+                    elem.removeAttribute("id")
+                for elem in c.node.querySelectorAll("[data-pui]"):
+                    elem.removeAttribute("data-pui") # Or dispose() would release live components
+        if on_restored:
+            on_restored()
+        return True
+
+    def clear_snapshot(self, name: str = "default") -> None:
+        """Deletes a snapshot saved by `snapshot`."""
+        window.localStorage.removeItem(self._snapshot_key(name))
+
+    def _snapshot_key(self, name: str) -> str:
+        return f"uilib-snapshot:{window.location.pathname}:{name}"
+
+def _input_components() -> List[Any]:
+    """Returns (key, component) pairs for every input component, keyed by class and creation order."""
+    counts = {}
+    result = []
+    for c in list(_component_registry.values()):
+        if isinstance(c, (Select, TextInput, TextArea, Checkbox, Slider, RadioGroup)):
+            name = type(c).__name__
+            counts[name] = counts.get(name, 0) + 1
+            result.append((f"{name}-{counts[name]}", c))
+    return result
+
+def _get_input_state(component: 'Component') -> Any:
+    if isinstance(component, Checkbox):
+        return component.is_checked()
+    return component.get_value()
+
+def _set_input_state(component: 'Component', value: Any) -> None:
+    if isinstance(component, Checkbox):
+        component.set_checked(value)
+    elif value is not None:
+        component.set_value(value)
+
+class Modal(Component):
+    """Creates a Bootstrap 5 modal dialog."""
+    __slots__ = ()
+    def __init__(self, title: str = "", body: str = "", footer: Optional[str] = None, modal_id: Optional[str] = None):
+        """
+        Args:
+            title (str, optional): The title text of the modal. Defaults to "".
+            body (str, optional): The body content (supports markdown). Defaults to "".
+            footer (str, optional): Optional footer content (supports markdown). Defaults to None.
+            modal_id (str, optional): Optional static ID for modal. Defaults to None.
+        """
+        super().__init__(tag="div")
+        self.set_class("modal fade")
+        self.node.setAttribute("tabindex", "-1")
+        self.node.setAttribute("aria-hidden", "true")
+        self.node.setAttribute("role", "dialog")
+
+        if modal_id:
+            self.node.setAttribute("id", modal_id)
+        else:
+            modal_id = self.id
+            self.node.setAttribute("id", modal_id)
+
+        # Modal Dialog
+        dialog = document.createElement("div")
+        dialog.setAttribute("class", "modal-dialog")
+        self.node.append(dialog)
+
+        # Modal Content
+        content = document.createElement("div")
+        content.setAttribute("class", "modal-content")
+        dialog.append(content)
+
+        # Modal Header
+        header = document.createElement("div")
+        header.setAttribute("class", "modal-header")
+        content.append(header)
+
+        title_elem = document.createElement("h5")
+        title_elem.setAttribute("class", "modal-title")
+        title_elem.append(document.createTextNode(title))
+        header.append(title_elem)
+
+        close_button = document.createElement("button")
+        close_button.setAttribute("type", "button")
+        close_button.setAttribute("class", "btn-close")
+        close_button.setAttribute("data-bs-dismiss", "modal")
+        close_button.setAttribute("aria-label", "Close")
+        header.append(close_button)
+
+        # Modal Body
+        body_elem = document.createElement("div")
+        body_elem.setAttribute("class", "modal-body")
+        # Render markdown in body
+        temp = document.createElement("div")
+        temp.innerHTML = md.markdown(body)
+        for child in list(temp.childNodes):
+            body_elem.append(child)
+        content.append(body_elem)
+
+        # Modal Footer (optional)
+        if footer is not None:
+            footer_elem = document.createElement("div")
+            footer_elem.setAttribute("class", "modal-footer")
+            temp_footer = document.createElement("div")
+            temp_footer.innerHTML = md.markdown(footer)
+            for child in list(temp_footer.childNodes):
+                footer_elem.append(child)
+            content.append(footer_elem)
+
+    def show(self):
+        """Shows the modal."""
+        js_modal = __import__("js").bootstrap.Modal.new(self.node)
+        js_modal.show()
+
+    def hide(self):
+        """Hides the modal."""
+        js_modal = __import__("js").bootstrap.Modal.new(self.node)
+        js_modal.hide()
+
+class LogView(Component):
+    """A bounded, virtualized log/console view for streaming text output."""
+    __slots__ = ("line_height", "lines", "spacer_elem", "window_elem", "_pinned", "_partial", "_frame_pending", "_first", "_rendered", "_frame_proxy", "_scroll_proxy")
+    def __init__(self, max_lines: int = 5000, height: str = "300px", line_height: int = 18, class_name: str = "border rounded bg-light font-monospace small"):
+        """
+        Lines are held in a ring buffer of at most `max_lines` entries; the oldest
+        lines are dropped once it is full. Appends are batched and written to the
+        DOM at most once per animation frame, and only the lines currently
+        scrolled into view are rendered, so the DOM stays the same size however
+        long the history is.
+
+        Args:
+            max_lines (int, optional): The maximum number of lines kept in the buffer. Defaults to 5000.
+            height (str, optional): The CSS height of the scrolling viewport. Defaults to "300px".
+            line_height (int, optional): The fixed height of a line in pixels, used for virtualization. Defaults to 18.
+            class_name (str, optional): The CSS class(es) for styling. Defaults to "border rounded bg-light font-monospace small".
+        """
+        super().__init__(tag="div")
+        self.set_class(class_name)
+        self.line_height = line_height
+        self.lines = deque(maxlen=max_lines)
+        self._pinned = True # Follow new output until the user scrolls up
+        self._partial = False # Whether the last line is still waiting for its newline
+        self._frame_pending = False
+        self._first = -1 # Index of the first rendered line, -1 forces a redraw
+        self._rendered = None
+
+        self.node.style.height = height
+        self.node.style.overflowY = "auto"
+        self.node.style.position = "relative"
+
+        # The spacer gives the viewport its full scroll height...
+        self.spacer_elem = document.createElement("div")
+        self.node.append(self.spacer_elem)
+        # ...while the window holds only the visible lines and is moved into place.
+        self.window_elem = document.createElement("pre")
+        self.window_elem.setAttribute("class", "m-0 px-2")
+        self.window_elem.style.position = "absolute"
+        self.window_elem.style.top = "0"
+        self.window_elem.style.left = "0"
+        self.window_elem.style.right = "0"
+        self.window_elem.style.lineHeight = f"{line_height}px"
+        self.window_elem.style.whiteSpace = "pre"
+        self.window_elem.style.overflow = "hidden"
+        self.node.append(self.window_elem)
+
+        # Proxies are created once and reused; a proxy per frame would leak.
+        self._frame_proxy = self._own_proxy(_create_proxy(self._on_frame))
+        self._scroll_proxy = self._own_proxy(_create_proxy(self._on_scroll))
+        self.node.addEventListener("scroll", self._scroll_proxy)
+
+    def write(self, text: str) -> None:
+        """
+        Appends text to the log, like a file: a newline ends the current line, and
+        text without one is continued by the next write. So `print(..., file=log)` works.
+        """
+        parts = str(text).split("\n")
+        if self._partial and self.lines:
+            self.lines[-1] += parts.pop(0)
+        if parts:
+            self._partial = parts[-1] != ""
+            if not self._partial:
+                parts.pop() # Text ending in a newline leaves no new line open
+            self.lines.extend(parts)
+        self._schedule()
+
+    def writelines(self, lines: Iterable[str]) -> None:
+        """
+        Appends several lines to the log in one batch. As with a file, each line
+        should end in a newline, as from readlines(); a line without one is left
+        open and continued by the next write.
+        """
+        self.write("".join(str(line) for line in lines))
+
+    def clear(self) -> 'LogView':
+        """Removes all lines from the log."""
+        self.lines.clear()
+        self._partial = False
+        self._pinned = True
+        self._schedule()
+        return self # Return self for chaining
+
+    def _schedule(self) -> None:
+        """Requests a redraw on the next animation frame, coalescing repeated calls."""
+        if not self._frame_pending:
+            self._frame_pending = True
+            window.requestAnimationFrame(self._frame_proxy)
+
+    def _on_frame(self, timestamp=None) -> None:
+        self._frame_pending = False
+        self.spacer_elem.style.height = f"{len(self.lines) * self.line_height}px"
+        if self._pinned:
+            self.node.scrollTop = self.node.scrollHeight
+        self._first = -1
+        self._render()
+
+    def _on_scroll(self, event) -> None:
+        node = self.node
+        self._pinned = node.scrollTop + node.clientHeight >= node.scrollHeight - self.line_height
+        self._render()
+
+    def _render(self) -> None:
+        """Renders only the lines that fall inside the visible part of the viewport."""
+        visible = int(self.node.clientHeight // self.line_height) + 2
+        first = max(0, min(int(self.node.scrollTop // self.line_height), len(self.lines) - visible))
+        if first == self._first and self._rendered is not None:
+            return # Nothing has moved
+        last = min(len(self.lines), first + visible)
+        text = "\n".join(self.lines[i] for i in range(first, last))
+        self._first = first
+        if text != self._rendered:
+            self.window_elem.textContent = text
+            self._rendered = text
+        self.window_elem.style.transform = f"translateY({first * self.line_height}px)"
+
+# The start of a list item, e.g. "- ", "* " or "2. ".
+_LIST_ITEM = re.compile(r"(?:[-*+]|\d+\.)\s")
+
+class MarkdownStream(Component):
+    """Renders markdown that arrives in chunks, such as text being generated a token at a time."""
+    __slots__ = ("tail_elem", "_pending")
+    def __init__(self, class_name: Optional[str] = None):
+        """
+        Completed blocks (paragraphs, lists, code fences, etc. followed by a blank
+        line and the start of a new block) are rendered once and appended as stable
+        nodes. Only the trailing, unfinished block is re-rendered as new chunks
+        arrive, so the cost of each update does not grow with the length of the document.
+
+        Args:
+            class_name (str, optional): The CSS class(es) to apply to the component. Defaults to None.
+        """
+        super().__init__(tag="div")
+        if class_name:
+            self.set_class(class_name)
+        self._pending = "" # Text of the trailing block that may still change
+        self.tail_elem = document.createElement("div")
+        self.node.append(self.tail_elem)
+
+    def append(self, chunk: str) -> None:
+        """Adds a chunk of markdown text to the end of the stream."""
+        self._pending += chunk
+        boundary = self._last_block_boundary(self._pending)
+        if boundary:
+            self._commit(self._pending[:boundary])
+            self._pending = self._pending[boundary:]
+        self.tail_elem.innerHTML = md.markdown(self._pending)
+
+    def finish(self) -> None:
+        """Marks the stream as complete, rendering the trailing block as a stable node."""
+        if self._pending.strip():
+            self._commit(self._pending)
+        self._pending = ""
+        self.tail_elem.innerHTML = ""
+
+    def clear(self) -> 'MarkdownStream':
+        """Removes all rendered content and discards any pending text."""
+        self._pending = ""
+        self.node.innerHTML = ""
+        self.tail_elem.innerHTML = ""
+        self.node.append(self.tail_elem)
+        return self # Return self for chaining
+
+    def _commit(self, text: str) -> None:
+        """Renders completed blocks and inserts them before the trailing block."""
+        temp_container = document.createElement("div")
+        temp_container.innerHTML = md.markdown(text)
+        for child in list(temp_container.childNodes):
+            self.node.insertBefore(child, self.tail_elem)
+
+    @staticmethod
+    def _last_block_boundary(text: str) -> int:
+        """
+        Returns the offset of the last block boundary that later text cannot change, or 0 if none.
+
+        A blank line outside a code fence only ends a block once the next line has
+        arrived and starts a new top-level block. Markdown carries indented lines, and
+        further items of the same list or blockquote, across a blank line.
+        """
+        boundary = 0
+        offset = 0
+        in_fence = False
+        block_kind = None # Kind of the first line of the current block
+        blank_end = None # Offset after the blank lines that may end the current block
+        for line in text.splitlines(keepends=True):
+            if not line.endswith("\n"):
+                break # The last line is still being written
+            stripped = line.strip()
+            if not stripped:
+                if block_kind is not None and not in_fence:
+                    blank_end = offset + len(line)
+            else:
+                kind = MarkdownStream._line_kind(line)
+                if blank_end is not None:
+                    if kind != "indented" and not (kind == block_kind and kind in ("list", "quote")):
+                        boundary = blank_end
+                        block_kind = kind
+                    blank_end = None
+                elif block_kind is None:
+                    block_kind = kind
+                if stripped.startswith("```") or stripped.startswith("~~~"):
+                    in_fence = not in_fence
+            offset += len(line)
+        return boundary
+
+    @staticmethod
+    def _line_kind(line: str) -> str:
+        """Classifies the start of a non-blank line for _last_block_boundary."""
+        if line[0] in " \t":
+            return "indented"
+        if _LIST_ITEM.match(line):
+            return "list"
+        if line.startswith(">"):
+            return "quote"
+        return "other"
+
+# Memory diagnostics
+
+def memory_report() -> dict:
+    """
+    Reports what a running app is holding on to, to help find leaks.
+
+    Returns:
+        dict: With keys
+            - "components": the number of live components of each class,
+            - "total_components": the number of live components,
+            - "detached_components": components whose node is no longer in the document,
+            - "proxies": proxies created by uilib that have not been destroyed,
+            - "figures": matplotlib pyplot figures still open.
+    """
+    import sys
+    counts = {}
+    detached = 0
+    for component in list(_component_registry.values()):
+        name = type(component).__name__
+        counts[name] = counts.get(name, 0) + 1
+        if not component.node.isConnected:
+            detached += 1
+    # Only count figures if the app has imported pyplot; importing it here would be slow.
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    return {
+        "components": counts,
+        "total_components": len(_component_registry),
+        "detached_components": detached,
+        "proxies": _proxy_counts["created"] - _proxy_counts["destroyed"],
+        "figures": len(pyplot.get_fignums()) if pyplot else 0,
+    }
+
+class MemoryWatchdog:
+    """Warns when memory_report() counts keep growing, e.g. across repeated redraws."""
+    METRICS = ("total_components", "detached_components", "proxies", "figures")
+
+    def __init__(self, checks: int = 3):
+        """
+        Call `check()` after each redraw, or `start()` to check on a timer. A warning
+        is printed when a count has grown on each of the last `checks` checks.
+
+        Args:
+            checks (int, optional): The number of consecutive increases that trigger a warning. Defaults to 3.
+        """
+        self.checks = checks
+        self.history = deque(maxlen=checks + 1)
+        self._interval = None
+        self._interval_proxy = None
+
+    def check(self) -> List[str]:
+        """Takes a memory report and returns (and prints) a warning for each count that keeps growing."""
+        report = memory_report()
+        self.history.append(report)
+        warnings = []
+        if len(self.history) == self.history.maxlen:
+            for metric in self.METRICS:
+                values = [r[metric] for r in self.history]
+                if all(b > a for a, b in zip(values, values[1:])):
+                    warnings.append(f"Warning: uilib {metric.replace('_', ' ')} grew on each of the last {self.checks} checks ({values[0]} -> {values[-1]}). This may be a leak.")
+        for warning in warnings:
+            print(warning)
+        return warnings
+
+    def start(self, interval_ms: int = 5000) -> None:
+        """Runs `check()` every `interval_ms` milliseconds until `stop()` is called."""
+        self.stop()
+        self._interval_proxy = _create_proxy(lambda: self.check())
+        self._interval = window.setInterval(self._interval_proxy, interval_ms)
+
+    def stop(self) -> None:
+        """Stops periodic checks started by `start()`."""
+        if self._interval is not None:
+            window.clearInterval(self._interval)
+            _destroy_proxy(self._interval_proxy)
+            self._interval = None
+            self._interval_proxy = None
+
+# Memoized component factories
+
+def memo(factory: Optional[Callable] = None, *, maxsize: int = 32) -> Callable:
+    """
+    Caches the components built by a factory function, keyed by its arguments.
+
+    Calling the factory again with the same arguments returns the same component
+    instead of building a new subtree; re-adding it to a container reattaches it
+    as it was. The least recently used components are disposed once more than
+    `maxsize` are cached, unless they are still on the page. Async factories are
+    supported. Arguments must be hashable.
+
+    Use as `@ui.memo` or `@ui.memo(maxsize=8)`. The decorated function has a
+    `cache_clear()` method that disposes every cached component not on the page.
+
+    Args:
+        factory (Callable, optional): The function that builds and returns a Component.
+        maxsize (int, optional): The maximum number of cached components. Defaults to 32.
+    """
+    def decorate(factory: Callable) -> Callable:
+        cache = OrderedDict()
+
+        def lookup(key: Any) -> Optional['Component']:
+            component = cache.get(key)
+            if component is not None and component.id in _component_registry:
+                cache.move_to_end(key)
+                return component
+            cache.pop(key, None) # Disposed elsewhere
+            return None
+
+        def store(key: Any, component: 'Component') -> 'Component':
+            cache[key] = component
+            while len(cache) > maxsize:
+                _, evicted = cache.popitem(last=False)
+                if not evicted.node.isConnected:
+                    evicted.dispose()
+            return component
+
+        if inspect.iscoroutinefunction(factory):
+            @functools.wraps(factory)
+            async def wrapper(*args, **kwargs):
+                key = (args, tuple(sorted(kwargs.items())))
+                return lookup(key) or store(key, await factory(*args, **kwargs))
+        else:
+            @functools.wraps(factory)
+            def wrapper(*args, **kwargs):
+                key = (args, tuple(sorted(kwargs.items())))
+                return lookup(key) or store(key, factory(*args, **kwargs))
+
+        def cache_clear() -> None:
+            while cache:
+                _, component = cache.popitem()
+                if not component.node.isConnected:
+                    component.dispose()
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorate(factory) if factory is not None else decorate
+
+# Event recording and replay
+
+def _input_states() -> dict:
+    """Returns the state of every input component, keyed by component id."""
+    return {c.id: _get_input_state(c) for _, c in _input_components()}
+
+class EventRecorder:
+    """Records the component events of a user session so that it can be replayed with `replay_events`."""
+    def __init__(self):
+        """
+        Each recorded event is a dict with the keys
+            - "time": seconds since recording started,
+            - "target": the id of the element that received the event,
+            - "type": the event type, e.g. "click" or "change",
+            - "inputs": {component id: value} for input components that changed since the previous event.
+
+        Component ids are assigned in creation order, so a recording can be replayed
+        against a fresh load of the same app.
+        """
+        self.events = []
+        self.initial = {}
+        self._start = None
+        self._last = {}
+
+    def start(self) -> 'EventRecorder':
+        """Starts recording, replacing any events already recorded. Returns self."""
+        global _recorder
+        self.events = []
+        self.initial = _input_states()
+        self._last = dict(self.initial)
+        self._start = time.perf_counter()
+        _recorder = self
+        return self
+
+    def stop(self) -> 'EventRecorder':
+        """Stops recording. Returns self."""
+        global _recorder
+        if _recorder is self:
+            _recorder = None
+        return self
+
+    def to_json(self) -> str:
+        """Returns the recording as JSON, e.g. to save it with the app."""
+        return json.dumps({"initial": self.initial, "events": self.events})
+
+    @classmethod
+    def from_json(cls, text: str) -> 'EventRecorder':
+        """Creates a recorder holding a recording saved with `to_json`."""
+        recorder = cls()
+        saved = json.loads(text)
+        recorder.initial = saved.get("initial", {})
+        recorder.events = saved["events"]
+        return recorder
+
+    def _record(self, component: 'Component', event: Any) -> None:
+        states = _input_states()
+        changed = {cid: value for cid, value in states.items() if self._last.get(cid) != value}
+        self._last = states
+        target = getattr(event, "target", None)
+        self.events.append({
+            "time": time.perf_counter() - self._start,
+            "target": target.id if target is not None and target.id else component.id,
+            "type": getattr(event, "type", "click"),
+            "inputs": changed,
+        })
+
+class ReplayReport:
+    """The timings from `replay_events`."""
+    def __init__(self, latencies: List[float], elapsed: float):
+        self.latencies = latencies # Milliseconds per event, including any async work the callback started
+        self.elapsed = elapsed # Seconds for the whole replay
+
+    def summary(self) -> dict:
+        """Returns the event count, throughput and latency percentiles (in milliseconds)."""
+        ordered = sorted(self.latencies)
+        def percentile(p):
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))] if ordered else 0.0
+        return {
+            "events": len(ordered),
+            "elapsed_s": self.elapsed,
+            "events_per_s": len(ordered) / self.elapsed if self.elapsed else 0.0,
+            "mean_ms": sum(ordered) / len(ordered) if ordered else 0.0,
+            "p50_ms": percentile(0.5),
+            "p95_ms": percentile(0.95),
+            "max_ms": ordered[-1] if ordered else 0.0,
+        }
+
+async def replay_events(events: Union['EventRecorder', List[dict]], speed: Optional[float] = None, repeat: int = 1) -> ReplayReport:
+    """
+    Replays recorded events against the running app and measures how long each takes.
+
+    For each event the recorded input values are set and a synthetic DOM event is
+    dispatched to the recorded element, so the app's callbacks run exactly as they
+    did for the user. Async callbacks are awaited before the next event.
+
+    Args:
+        events (Union[EventRecorder, List[dict]]): A recorder, or a list of event dicts in the format it records. Lists can be generated to simulate load; "time" and "inputs" are optional.
+        speed (float, optional): How many times faster than recorded to replay, keeping the gaps between events in proportion. Defaults to None, which replays as fast as possible.
+        repeat (int, optional): How many times to replay the whole sequence. Defaults to 1.
+
+    Returns:
+        ReplayReport: The latency of each event and the total elapsed time.
+    """
+    global _replay_tasks
+    initial = {}
+    if isinstance(events, EventRecorder):
+        initial, events = events.initial, events.events
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        _apply_input_states(initial)
+        previous = None
+        for event in events:
+            if speed and previous is not None:
+                await asyncio.sleep(max(0.0, (event.get("time", 0.0) - previous) / speed))
+            previous = event.get("time", 0.0)
+            _apply_input_states(event.get("inputs", {}))
+            target = document.getElementById(event["target"])
+            if target is None:
+                print(f"Warning: uilib replay target '{event['target']}' not found; skipping event.")
+                continue
+            _replay_tasks = []
+            began = time.perf_counter()
+            try:
+                target.dispatchEvent(window.Event.new(event["type"], to_js({"bubbles": True}, dict_converter=window.Object.fromEntries)))
+                while _replay_tasks:
+                    await _replay_tasks.pop()
+            finally:
+                _replay_tasks = None
+            latencies.append((time.perf_counter() - began) * 1000)
+    return ReplayReport(latencies, time.perf_counter() - start)
+
+def _apply_input_states(states: dict) -> None:
+    for cid, value in states.items():
+        component = _component_registry.get(cid)
+        if component is not None:
+            _set_input_state(component, value)
+
+# Optional submodules
+#
+# Charts and data helpers need NumPy, which is slow to import in the browser.
+# They live in submodules that are only imported when one of their names is
+# first used, so `ui.DataSource` and `from uilib import Heatmap` still work.
+
+_lazy_exports = {
+    "lttb": "charts", "minmax_downsample": "charts", "downsample": "charts",
+    "plotly_json": "charts", "show_plotly": "charts",
+    "TimeSeriesChart": "charts", "CanvasImage": "charts", "Heatmap": "charts",
+    "sparkline_path": "charts", "Sparkline": "charts", "KPITile": "charts",
+    "DataCache": "data", "load_dataframe": "data",
+    "DataSource": "data", "DataDelta": "data", "Aggregate": "data", "CrossFilter": "data",
+}
+
+def __getattr__(name: str) -> Any:
+    module = _lazy_exports.get(name)
+    if module is None:
+        raise AttributeError(f"module 'uilib' has no attribute '{name}'")
+    import importlib
+    value = getattr(importlib.import_module(f"uilib.{module}"), name)
+    globals()[name] = value # Later lookups skip this function
+    return value
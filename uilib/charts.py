@@ -0,0 +1,543 @@
+# uilib/charts.py - Charts and images for uilib
+#
+# Optional part of uilib that depends on NumPy (and matplotlib for colormaps).
+# It is imported the first time one of its names is used, e.g. `ui.TimeSeriesChart`,
+# so apps that do not use it do not pay for importing NumPy at startup.
+#
+# MIT License - see uilib/__init__.py.
+
+import base64
+import json
+import numpy as np
+from pyodide.ffi import to_js
+from typing import Any, Optional
+
+from . import Component, _clone_prototype, _create_proxy, _destroy_proxy, document, window
+
+# Downsampling helpers for large series
+
+def lttb(x: Any, y: Any, n_out: int) -> Any:
+    """
+    Selects `n_out` points from a series using Largest-Triangle-Three-Buckets.
+
+    LTTB keeps the points that preserve the visual shape of a line, so a chart of
+    the result is nearly indistinguishable from a chart of the full series.
+
+    Args:
+        x (array-like): The x values, sorted in ascending order. Must be numeric.
+        y (array-like): The y values, the same length as `x`.
+        n_out (int): The number of points to keep.
+
+    Returns:
+        numpy.ndarray: The indices of the selected points, in ascending order.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # The first and last points are always kept; the rest are split into buckets.
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # The average point of each bucket is used as the third vertex of the triangle.
+    sums_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    avg_x = np.append(sums_x / counts, x[-1])
+    avg_y = np.append(sums_y / counts, y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        bx, by = x[start:end], y[start:end]
+        # Twice the triangle area; the constant factor does not change the argmax.
+        areas = np.abs((x[a] - avg_x[i + 1]) * (by - y[a]) - (x[a] - bx) * (avg_y[i + 1] - y[a]))
+        a = start + int(np.argmax(areas))
+        selected[i + 1] = a
+    return selected
+
+def minmax_downsample(x: Any, y: Any, n_buckets: int) -> Any:
+    """
+    Selects the first, last, minimum and maximum point of each of `n_buckets` equal buckets.
+
+    This is cheaper than LTTB and never hides a spike, which makes it a good fit for
+    noisy signals.
+
+    Args:
+        x (array-like): The x values, sorted in ascending order.
+        y (array-like): The y values, the same length as `x`.
+        n_buckets (int): The number of buckets. Up to four points are kept per bucket.
+
+    Returns:
+        numpy.ndarray: The indices of the selected points, in ascending order.
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_buckets * 4 >= n or n_buckets < 1:
+        return np.arange(n)
+
+    size = -(-n // n_buckets) # Ceiling division
+    # Pad with the final value so the series reshapes into equal rows.
+    padded = np.pad(y, (0, size * n_buckets - n), mode="edge").reshape(n_buckets, size)
+    starts = np.arange(n_buckets) * size
+    indices = np.concatenate((
+        starts,
+        starts + padded.argmin(axis=1),
+        starts + padded.argmax(axis=1),
+        starts + size - 1,
+    ))
+    return np.unique(np.minimum(indices, n - 1))
+
+def downsample(x: Any, y: Any, n_out: int, method: str = "lttb") -> Any:
+    """
+    Reduces a series to roughly `n_out` points, e.g. before passing it to `px.line` or `plt.plot`.
+
+    Args:
+        x (array-like): The x values, sorted in ascending order. May be numeric or datetime64.
+        y (array-like): The y values, the same length as `x`.
+        n_out (int): The target number of points, typically the chart width in pixels.
+        method (str, optional): Either "lttb" or "minmax". Defaults to "lttb".
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The downsampled x and y values.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if method == "lttb":
+        indices = lttb(_as_float(x), y, n_out)
+    elif method == "minmax":
+        indices = minmax_downsample(x, y, max(1, n_out // 4))
+    else:
+        raise ValueError(f"Unknown downsampling method '{method}'. Use 'lttb' or 'minmax'.")
+    return x[indices], y[indices]
+
+def _as_float(x: Any) -> Any:
+    """Returns x as floats, converting datetime64 values to milliseconds since the epoch."""
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[ms]").astype(np.int64).astype(float)
+    return x.astype(float)
+
+class TimeSeriesChart(Component):
+    """An interactive Plotly line chart that downsamples large series to the chart's pixel width."""
+    __slots__ = ("title", "method", "points_per_pixel", "x", "series", "_xf", "_range", "_plotted", "_width", "_relayout_proxy", "_resize_observer")
+    def __init__(self, x: Any, y: Any, title: str = "", method: str = "lttb", height: str = "400px", points_per_pixel: float = 1.0):
+        """
+        Only as many points as the chart can show are sent to the browser. When the
+        user zooms or pans, the visible range is re-sampled from the full series, so
+        detail appears as they zoom in whatever the length of the source data.
+        The first draw waits until the chart is on the page and has a width.
+
+        Args:
+            x (array-like): The x values, sorted in ascending order. May be numeric or datetime64.
+            y (Union[array-like, dict]): The y values, or a dict mapping trace names to y values that share `x`.
+            title (str, optional): The chart title. Defaults to "".
+            method (str, optional): The downsampling method, "lttb" or "minmax". Defaults to "lttb".
+            height (str, optional): The CSS height of the chart. Defaults to "400px".
+            points_per_pixel (float, optional): How many points to keep per pixel of chart width. Defaults to 1.0.
+        """
+        super().__init__(tag="div")
+        self.node.style.height = height
+        self.title = title
+        self.method = method
+        self.points_per_pixel = points_per_pixel
+        self._plotted = False
+        self._width = 0
+        self._resize_observer = None
+        self._relayout_proxy = self._own_proxy(_create_proxy(self._on_relayout))
+        self.set_data(x, y)
+
+    def set_data(self, x: Any, y: Any) -> None:
+        """Replaces the chart's data and redraws it over the full range."""
+        self.x = np.asarray(x)
+        self._xf = _as_float(self.x)
+        self.series = {k: np.asarray(v) for k, v in y.items()} if isinstance(y, dict) else {"": np.asarray(y)}
+        self._range = None
+        self.redraw()
+
+    def redraw(self) -> None:
+        """Re-samples the visible range and redraws the chart."""
+        Plotly = window.Plotly
+        width = self.node.clientWidth or self._width # A hidden chart keeps its last width
+        if not width:
+            self._wait_for_layout()
+            return
+        self._width = width
+
+        lo, hi = 0, len(self.x)
+        if self._range is not None:
+            lo = max(0, int(np.searchsorted(self._xf, self._range[0], side="left")) - 1)
+            hi = min(len(self.x), int(np.searchsorted(self._xf, self._range[1], side="right")) + 1)
+        n_out = max(3, int(width * self.points_per_pixel))
+
+        traces = []
+        for name, y in self.series.items():
+            xs, ys = downsample(self.x[lo:hi], y[lo:hi], n_out, self.method)
+            traces.append({"x": _encode_array(xs), "y": _encode_array(ys), "type": "scattergl" if len(xs) > 1000 else "scatter", "mode": "lines", "name": name})
+
+        layout = {"title": {"text": self.title}, "uirevision": "keep", "showlegend": len(self.series) > 1, "margin": {"t": 40, "r": 10, "b": 40, "l": 50}}
+        data = to_js(traces, dict_converter=window.Object.fromEntries)
+        layout = to_js(layout, dict_converter=window.Object.fromEntries)
+        if self._plotted:
+            Plotly.react(self.node, data, layout)
+        else:
+            Plotly.newPlot(self.node, data, layout, to_js({"responsive": True}, dict_converter=window.Object.fromEntries))
+            self.node.on("plotly_relayout", self._relayout_proxy)
+            self._plotted = True
+
+    def _wait_for_layout(self) -> None:
+        """Defers drawing until the chart is laid out, as a detached node has no width to sample to."""
+        if self._resize_observer is None:
+            self._resize_observer = window.ResizeObserver.new(self._own_proxy(_create_proxy(self._on_resize)))
+            self._resize_observer.observe(self.node)
+
+    def _on_resize(self, entries, observer=None) -> None:
+        if self.node.clientWidth:
+            self._resize_observer.disconnect()
+            self._resize_observer = None
+            self.redraw()
+
+    def _on_relayout(self, event) -> None:
+        event = event.to_py() if hasattr(event, "to_py") else event
+        if event.get("xaxis.autorange"):
+            self._range = None
+        elif "xaxis.range[0]" in event:
+            bounds = [event["xaxis.range[0]"], event["xaxis.range[1]"]]
+            if np.issubdtype(self.x.dtype, np.datetime64):
+                bounds = [_as_float(np.array([str(b).replace(" ", "T")], dtype="datetime64[ms]"))[0] for b in bounds]
+            self._range = (float(bounds[0]), float(bounds[1]))
+        else:
+            return # Not a change to the x range
+        self.redraw()
+
+# Binary Plotly transfer
+
+# NumPy dtypes that Plotly.js can decode from a typed-array spec, and their codes.
+_TYPED_ARRAY_CODES = {
+    "int8": "i1", "uint8": "u1", "int16": "i2", "uint16": "u2",
+    "int32": "i4", "uint32": "u4", "float32": "f4", "float64": "f8",
+}
+
+def _encode_array(values: Any) -> Any:
+    """
+    Encodes an array for Plotly.js without building a Python list of its values.
+
+    Numeric arrays become Plotly's typed-array spec, `{"dtype", "bdata", "shape"}`,
+    where `bdata` is the base64 of the raw little-endian buffer. Plotly.js 2.28 and
+    later decode this straight into a JavaScript typed array. Datetimes become ISO
+    strings and anything else falls back to a list.
+    """
+    values = np.asarray(values)
+    kind = values.dtype.kind
+    if kind == "M":
+        return np.datetime_as_string(values, unit="ms").tolist()
+    if kind == "b":
+        values = values.astype(np.uint8)
+    elif kind in "iu" and values.dtype.name not in _TYPED_ARRAY_CODES:
+        # Plotly.js has no 64-bit integer arrays; use 32 bits when the values fit.
+        info = np.iinfo(np.int32)
+        small = values.size == 0 or (values.min() >= info.min and values.max() <= info.max)
+        values = values.astype(np.int32 if small else np.float64)
+    elif kind == "f" and values.dtype.name not in _TYPED_ARRAY_CODES:
+        values = values.astype(np.float64)
+    elif kind not in "iuf":
+        return values.tolist()
+    values = np.ascontiguousarray(values, dtype=values.dtype.newbyteorder("<"))
+    spec = {"dtype": _TYPED_ARRAY_CODES[values.dtype.name], "bdata": base64.b64encode(values.data).decode("ascii")}
+    if values.ndim > 1:
+        spec["shape"] = ", ".join(str(n) for n in values.shape)
+    return spec
+
+def _encode_plotly(obj: Any) -> Any:
+    """Recursively replaces arrays in a Plotly figure structure with binary specs."""
+    if isinstance(obj, dict):
+        return {k: _encode_plotly(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_encode_plotly(v) for v in obj]
+    if isinstance(obj, np.ndarray):
+        return _encode_array(obj)
+    if hasattr(obj, "to_numpy") and hasattr(obj, "dtype"): # pandas Series or Index
+        return _encode_array(obj.to_numpy())
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return obj
+
+def plotly_json(fig: Any) -> str:
+    """
+    Serializes a Plotly figure to JSON with its arrays in Plotly's binary typed-array format.
+
+    This is much smaller and faster to parse than writing every number out as text.
+    plotly.py 6 and later already encode arrays this way; with older versions the
+    arrays are encoded here. Animation frames are included.
+
+    Args:
+        fig (plotly.graph_objects.Figure): The figure to serialize.
+
+    Returns:
+        str: The JSON, with "data", "layout" and "frames" keys.
+    """
+    from plotly.utils import PlotlyJSONEncoder
+    # to_plotly_json() is to_dict(), which deep-copies the figure; arrays that are
+    # already encoded as typed-array specs pass through _encode_plotly unchanged.
+    figure = fig.to_plotly_json()
+    return json.dumps({
+        "data": _encode_plotly(figure.get("data", [])),
+        "layout": _encode_plotly(figure.get("layout", {})),
+        "frames": _encode_plotly(figure.get("frames", [])),
+    }, cls=PlotlyJSONEncoder)
+
+def show_plotly(parent_node: Any, fig: Any, append: bool = True) -> Any:
+    """
+    Draws a Plotly figure into a DOM node with Plotly.newPlot, transferring its arrays in binary.
+
+    Requires Plotly.js 2.28 or later to be loaded on the page.
+
+    Args:
+        parent_node: The DOM node to draw into.
+        fig (plotly.graph_objects.Figure): The figure to draw.
+        append (bool, optional): If False, the node's existing content is removed first. Defaults to True.
+
+    Returns:
+        The DOM node holding the chart.
+    """
+    if not append:
+        parent_node.innerHTML = ""
+    chart_node = document.createElement("div")
+    parent_node.append(chart_node)
+    figure = window.JSON.parse(plotly_json(fig))
+    figure.config = to_js({"responsive": True}, dict_converter=window.Object.fromEntries)
+    # Passing a {data, layout, frames, config} object keeps animation frames working.
+    window.Plotly.newPlot(chart_node, figure)
+    return chart_node
+
+# Canvas images
+
+def _colormap_lut(cmap: str) -> Any:
+    """Returns a (256, 4) uint8 RGBA lookup table for a colormap name."""
+    try:
+        from matplotlib import colormaps
+        return np.ascontiguousarray(colormaps[cmap](np.linspace(0, 1, 256), bytes=True), dtype=np.uint8)
+    except ImportError:
+        if cmap not in ("gray", "grey"):
+            raise ValueError(f"Colormap '{cmap}' needs matplotlib; only 'gray' is available without it.")
+        ramp = np.arange(256, dtype=np.uint8)
+        return np.stack([ramp, ramp, ramp, np.full(256, 255, dtype=np.uint8)], axis=1)
+
+class CanvasImage(Component):
+    """Draws a NumPy array into a <canvas>, suitable for live frames at video rates."""
+    __slots__ = ("canvas_elem", "context", "cmap", "vmin", "vmax", "_lut", "_rgba", "_index", "_scratch")
+
+    def __init__(self, array: Any = None, cmap: str = "gray", vmin: Optional[float] = None, vmax: Optional[float] = None, width: str = "100%", pixelated: bool = True):
+        """
+        2D arrays are mapped through a colormap with vectorized NumPy code; arrays of
+        shape (height, width, 3 or 4) of uint8 are drawn as RGB(A) directly. Pixel
+        data is handed to the canvas as a view of the NumPy buffer, so no per-pixel
+        copies are made in Python, and the buffers are reused between frames.
+
+        Args:
+            array (array-like, optional): The initial image. Defaults to None.
+            cmap (str, optional): The colormap for 2D arrays. Any matplotlib colormap name. Defaults to "gray".
+            vmin (float, optional): The value mapped to the bottom of the colormap. Defaults to each frame's minimum.
+            vmax (float, optional): The value mapped to the top of the colormap. Defaults to each frame's maximum.
+            width (str, optional): The CSS width of the canvas; it is scaled to fit. Defaults to "100%".
+            pixelated (bool, optional): If True, scaled pixels stay sharp rather than being smoothed. Defaults to True.
+        """
+        super().__init__(tag="div")
+        self.canvas_elem = document.createElement("canvas")
+        self.canvas_elem.style.width = width
+        if pixelated:
+            self.canvas_elem.style.imageRendering = "pixelated"
+        self.node.append(self.canvas_elem)
+        self.context = self.canvas_elem.getContext("2d")
+        self.vmin = vmin
+        self.vmax = vmax
+        self._rgba = None
+        self._index = None
+        self._scratch = None
+        self.set_colormap(cmap)
+        if array is not None:
+            self.update(array)
+
+    def set_colormap(self, cmap: str) -> None:
+        """Changes the colormap used for subsequent frames."""
+        self.cmap = cmap
+        self._lut = _colormap_lut(cmap)
+
+    def update(self, array: Any) -> None:
+        """Draws a new frame, replacing the current image in place."""
+        array = np.asarray(array)
+        height, width = array.shape[:2]
+        if self._rgba is None or self._rgba.shape[:2] != (height, width):
+            # Buffers are allocated once per frame size and reused for every frame.
+            self._rgba = np.empty((height, width, 4), dtype=np.uint8)
+            self._index = np.empty((height, width), dtype=np.uint8)
+            self._scratch = np.empty((height, width), dtype=np.float32)
+            self.canvas_elem.width = width
+            self.canvas_elem.height = height
+
+        if array.ndim == 2:
+            lo = float(np.nanmin(array)) if self.vmin is None else self.vmin
+            hi = float(np.nanmax(array)) if self.vmax is None else self.vmax
+            scratch = self._scratch
+            np.subtract(array, lo, out=scratch, casting="unsafe")
+            np.multiply(scratch, 255.0 / (hi - lo) if hi > lo else 0.0, out=scratch)
+            np.clip(scratch, 0, 255, out=scratch)
+            np.nan_to_num(scratch, copy=False)
+            np.copyto(self._index, scratch, casting="unsafe")
+            np.take(self._lut, self._index, axis=0, out=self._rgba)
+        elif array.ndim == 3 and array.shape[2] == 4:
+            np.copyto(self._rgba, array, casting="unsafe")
+        elif array.ndim == 3 and array.shape[2] == 3:
+            np.copyto(self._rgba[..., :3], array, casting="unsafe")
+            self._rgba[..., 3] = 255
+        else:
+            raise ValueError(f"CanvasImage expects a 2D array or an RGB(A) image, got shape {array.shape}.")
+        self._blit()
+
+    def _blit(self) -> None:
+        """Copies the RGBA buffer to the canvas through a view of the WebAssembly memory."""
+        height, width = self._rgba.shape[:2]
+        proxy = _create_proxy(self._rgba)
+        buffer = proxy.getBuffer("u8clamped")
+        try:
+            # buffer.data is a Uint8ClampedArray over the NumPy data itself, not a copy.
+            image = window.ImageData.new(buffer.data, width, height)
+            self.context.putImageData(image, 0, 0)
+        finally:
+            buffer.release()
+            _destroy_proxy(proxy)
+
+class Heatmap(CanvasImage):
+    """A CanvasImage for 2D scalar grids, using a perceptual colormap by default."""
+    __slots__ = ()
+
+    def __init__(self, array: Any = None, cmap: str = "viridis", vmin: Optional[float] = None, vmax: Optional[float] = None, width: str = "100%"):
+        """
+        Args:
+            array (array-like, optional): The initial 2D grid of values. Defaults to None.
+            cmap (str, optional): The colormap. Any matplotlib colormap name. Defaults to "viridis".
+            vmin (float, optional): The value mapped to the bottom of the colormap. Fix this for live data so colors stay comparable between frames. Defaults to each frame's minimum.
+            vmax (float, optional): The value mapped to the top of the colormap. Defaults to each frame's maximum.
+            width (str, optional): The CSS width of the canvas; it is scaled to fit. Defaults to "100%".
+        """
+        super().__init__(array, cmap=cmap, vmin=vmin, vmax=vmax, width=width, pixelated=True)
+
+# Sparklines and KPI tiles
+
+SVG_NS = "http://www.w3.org/2000/svg"
+
+def sparkline_path(values: Any, width: float = 100, height: float = 30, max_points: Optional[int] = None) -> str:
+    """
+    Returns an SVG path `d` attribute drawing `values` as a line filling a width x height box.
+
+    Args:
+        values (array-like): The values to draw, in order.
+        width (float, optional): The width of the box in SVG units. Defaults to 100.
+        height (float, optional): The height of the box in SVG units. Defaults to 30.
+        max_points (int, optional): If the series is longer than this, it is downsampled with LTTB first. Defaults to twice `width`.
+
+    Returns:
+        str: The path data, or "" if there are no finite values.
+    """
+    y = np.asarray(values, dtype=float)
+    y = y[np.isfinite(y)]
+    if len(y) == 0:
+        return ""
+    max_points = max_points or int(2 * width)
+    if len(y) > max_points:
+        y = y[lttb(np.arange(len(y)), y, max_points)]
+    lo, hi = y.min(), y.max()
+    # Leave half a unit at top and bottom so the stroke is not clipped.
+    scale = (height - 1) / (hi - lo) if hi > lo else 0.0
+    ys = height - 0.5 - (y - lo) * scale if scale else np.full(len(y), height / 2)
+    xs = np.linspace(0, width, len(y)) if len(y) > 1 else np.array([0.0])
+    points = np.column_stack((xs, ys)).round(1).tolist()
+    return "M" + "L".join(f"{x:g},{y:g}" for x, y in points)
+
+class Sparkline(Component):
+    """A small inline SVG line chart, cheap enough to show hundreds on a page."""
+    __slots__ = ("path_elem", "width", "height")
+
+    def __init__(self, values: Any = None, width: int = 100, height: int = 30, color: str = "currentColor", stroke_width: float = 1.5):
+        """
+        The path is computed in Python and `update` only replaces its `d` attribute,
+        so refreshing a sparkline is a single DOM write.
+
+        Args:
+            values (array-like, optional): The initial values. Defaults to None.
+            width (int, optional): The width of the drawing in SVG units; it is scaled to the width of its container. Defaults to 100.
+            height (int, optional): The height in pixels. Defaults to 30.
+            color (str, optional): The CSS color of the line. Defaults to "currentColor", the text color.
+            stroke_width (float, optional): The line width in pixels. Defaults to 1.5.
+        """
+        key = ("Sparkline", width, height, color, stroke_width)
+        super().__init__(node=_clone_prototype(key, lambda: self._prototype(width, height, color, stroke_width)))
+        self.path_elem = self.node.firstElementChild
+        self.width = width
+        self.height = height
+        if values is not None:
+            self.update(values)
+
+    def update(self, values: Any) -> None:
+        """Redraws the line for new values."""
+        self.path_elem.setAttribute("d", sparkline_path(values, self.width, self.height))
+
+    @staticmethod
+    def _prototype(width: int, height: int, color: str, stroke_width: float) -> Any:
+        """Builds the SVG subtree that Sparkline instances are cloned from."""
+        node = document.createElementNS(SVG_NS, "svg")
+        node.setAttribute("viewBox", f"0 0 {width} {height}")
+        node.setAttribute("preserveAspectRatio", "none")
+        node.setAttribute("width", "100%")
+        node.setAttribute("height", str(height))
+        path_elem = document.createElementNS(SVG_NS, "path")
+        path_elem.setAttribute("fill", "none")
+        path_elem.setAttribute("stroke", color)
+        path_elem.setAttribute("stroke-width", str(stroke_width))
+        path_elem.setAttribute("vector-effect", "non-scaling-stroke") # Keep the line width constant when scaled
+        node.append(path_elem)
+        return node
+
+class KPITile(Component):
+    """A compact metric tile showing a title, a current value and an optional sparkline of its trend."""
+    __slots__ = ("value_elem", "sparkline", "fmt")
+
+    def __init__(self, title: str = "", value: Any = None, values: Any = None, fmt: str = "{}", class_name: str = "bg-primary text-center text-white p-2 my-1"):
+        """
+        Args:
+            title (str, optional): The label shown above the value. Defaults to "".
+            value (Any, optional): The current value. If None, the value is left blank. Defaults to None.
+            values (array-like, optional): A history of values to draw as a sparkline. If None, no sparkline is shown. Defaults to None.
+            fmt (str, optional): A format string applied to the value, e.g. "${:,.0f}". Defaults to "{}".
+            class_name (str, optional): The CSS class(es) for styling. Defaults to the SmallBanner style.
+        """
+        super().__init__(tag="div")
+        self.set_class(class_name)
+        self.fmt = fmt
+
+        title_elem = document.createElement("div")
+        title_elem.setAttribute("class", "small text-uppercase opacity-75")
+        title_elem.append(document.createTextNode(title))
+        self.node.append(title_elem)
+
+        self.value_elem = document.createElement("div")
+        self.value_elem.setAttribute("class", "fs-3")
+        self.node.append(self.value_elem)
+
+        self.sparkline = None
+        if values is not None:
+            self.sparkline = Sparkline(values)
+            self.sparkline.add_to(self.node)
+        self.set_value(value)
+
+    def set_value(self, value: Any) -> None:
+        """Replaces the displayed value. None leaves it blank."""
+        self.value_elem.textContent = "" if value is None else self.fmt.format(value)
+
+    def update(self, value: Any, values: Any = None) -> None:
+        """Replaces the displayed value and, if given and the tile has a sparkline, its trend."""
+        self.set_value(value)
+        if values is not None and self.sparkline is not None:
+            self.sparkline.update(values)
@@ -0,0 +1,647 @@
+# uilib/data.py - Data loading and aggregation for uilib
+#
+# Optional part of uilib that depends on NumPy (and pandas for DataFrames).
+# It is imported the first time one of its names is used, e.g. `ui.DataSource`,
+# so apps that do not use it do not pay for importing NumPy at startup.
+#
+# MIT License - see uilib/__init__.py.
+
+import asyncio
+import inspect
+import pickle
+import numpy as np
+from pyodide.ffi import to_js
+from typing import Any, Callable, Iterable, List, Optional
+
+from . import _create_proxy, _destroy_proxy, window
+
+# Persistent data cache
+
+# DataFrames loaded during this session, keyed by source and version.
+_data_memo = {}
+_default_data_cache = None
+
+def _idb_wait(target: Any, success: str = "onsuccess", error: str = "onerror", abort: Optional[str] = None) -> Any:
+    """
+    Returns a future that resolves when an IndexedDB request or transaction completes.
+
+    For transactions pass `abort="onabort"`: a transaction aborted e.g. for exceeding
+    the storage quota may not fire `error`, and the future would never resolve.
+    """
+    future = asyncio.get_event_loop().create_future()
+    handlers = []
+    def release():
+        for proxy in handlers:
+            _destroy_proxy(proxy)
+        handlers.clear()
+    def on_success(event):
+        if not future.done():
+            future.set_result(getattr(target, "result", None))
+        release()
+    def on_error(event):
+        if not future.done():
+            future.set_exception(RuntimeError(f"IndexedDB error: {target.error}"))
+        release()
+    for name, handler in ((success, on_success), (error, on_error), (abort, on_error)):
+        if name is not None:
+            proxy = _create_proxy(handler)
+            handlers.append(proxy)
+            setattr(target, name, proxy)
+    return future
+
+class DataCache:
+    """A size-bounded binary cache in the browser's IndexedDB that survives page reloads."""
+    def __init__(self, db_name: str = "uilib-cache", max_bytes: int = 100 * 1024 * 1024):
+        """
+        Args:
+            db_name (str, optional): The name of the IndexedDB database. Defaults to "uilib-cache".
+            max_bytes (int, optional): The total size of cached data above which the least recently used entries are evicted. Defaults to 100 MB.
+        """
+        self.db_name = db_name
+        self.max_bytes = max_bytes
+        self._db = None
+
+    async def _open(self) -> Any:
+        if self._db is None:
+            request = window.indexedDB.open(self.db_name, 1)
+            def on_upgrade(event):
+                db = request.result
+                db.createObjectStore("data")
+                db.createObjectStore("meta")
+            upgrade_proxy = _create_proxy(on_upgrade)
+            request.onupgradeneeded = upgrade_proxy
+            try:
+                self._db = await _idb_wait(request)
+            finally:
+                _destroy_proxy(upgrade_proxy)
+        return self._db
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Returns the bytes stored under `key`, or None if there is no entry."""
+        db = await self._open()
+        tx = db.transaction("data", "readonly")
+        result = await _idb_wait(tx.objectStore("data").get(key))
+        if result is None:
+            return None
+        data = bytes(result.to_py())
+        await self._touch(key)
+        return data
+
+    async def put(self, key: str, data: bytes, group: Optional[str] = None) -> None:
+        """
+        Stores `data` under `key`, evicting least recently used entries to stay within `max_bytes`.
+
+        Entries sharing a `group` (e.g. the same source at another version) are replaced.
+        """
+        if len(data) > self.max_bytes:
+            return # Would evict everything and still not fit
+        entries = await self._entries()
+        doomed = [k for k, m in entries.items() if k != key and group is not None and m.get("group") == group]
+        used = sum(m["size"] for k, m in entries.items() if k != key and k not in doomed)
+        for k, m in sorted(entries.items(), key=lambda item: item[1]["used"]):
+            if used + len(data) <= self.max_bytes:
+                break
+            if k != key and k not in doomed:
+                doomed.append(k)
+                used -= m["size"]
+
+        db = await self._open()
+        tx = db.transaction(to_js(["data", "meta"]), "readwrite")
+        data_store, meta_store = tx.objectStore("data"), tx.objectStore("meta")
+        for k in doomed:
+            data_store.delete(k)
+            meta_store.delete(k)
+        data_store.put(to_js(data), key)
+        meta = {"size": len(data), "used": window.Date.now(), "group": group}
+        meta_store.put(to_js(meta, dict_converter=window.Object.fromEntries), key)
+        await _idb_wait(tx, "oncomplete", "onerror", "onabort")
+
+    async def delete(self, key: str) -> None:
+        """Removes the entry stored under `key`, if any."""
+        db = await self._open()
+        tx = db.transaction(to_js(["data", "meta"]), "readwrite")
+        tx.objectStore("data").delete(key)
+        tx.objectStore("meta").delete(key)
+        await _idb_wait(tx, "oncomplete", "onerror", "onabort")
+
+    async def clear(self) -> None:
+        """Removes every entry from the cache."""
+        db = await self._open()
+        tx = db.transaction(to_js(["data", "meta"]), "readwrite")
+        tx.objectStore("data").clear()
+        tx.objectStore("meta").clear()
+        await _idb_wait(tx, "oncomplete", "onerror", "onabort")
+
+    async def _entries(self) -> dict:
+        """Returns the metadata of every entry, keyed by entry key."""
+        db = await self._open()
+        # Both reads go on one transaction, so a put committing in between cannot misalign them.
+        store = db.transaction("meta", "readonly").objectStore("meta")
+        keys, values = await asyncio.gather(_idb_wait(store.getAllKeys()), _idb_wait(store.getAll()))
+        return dict(zip(keys.to_py(), values.to_py()))
+
+    async def _touch(self, key: str) -> None:
+        """Records that `key` was just used, so it is evicted last."""
+        db = await self._open()
+        store = db.transaction("meta", "readwrite").objectStore("meta")
+        meta = await _idb_wait(store.get(key))
+        if meta is not None:
+            meta.used = window.Date.now()
+            store = db.transaction("meta", "readwrite").objectStore("meta")
+            await _idb_wait(store.put(meta, key))
+
+def _default_cache() -> DataCache:
+    global _default_data_cache
+    if _default_data_cache is None:
+        _default_data_cache = DataCache()
+    return _default_data_cache
+
+async def load_dataframe(source: str, loader: Optional[Callable] = None, version: str = "1", cache: Optional[DataCache] = None) -> Any:
+    """
+    Loads a pandas DataFrame once and keeps it across page reloads.
+
+    The first call fetches and parses the data and stores it, in pickled binary
+    form, in the browser's IndexedDB. Later calls in the same session return the
+    in-memory copy, and calls after a reload read the stored bytes back without
+    fetching or parsing anything. Bump `version` to invalidate the stored copy.
+
+    Args:
+        source (str): A URL or path of a CSV file, or any name identifying the data when `loader` is given.
+        loader (Callable, optional): A function (sync or async) returning the DataFrame, e.g. `px.data.iris`. If None, `source` is fetched and parsed as CSV. Defaults to None.
+        version (str, optional): The version of the data. Defaults to "1".
+        cache (DataCache, optional): The cache to use. Defaults to a shared `DataCache`.
+
+    Returns:
+        pandas.DataFrame: The loaded data.
+    """
+    key = f"{source}@{version}"
+    if key in _data_memo:
+        return _data_memo[key]
+
+    cache = cache or _default_cache()
+    try:
+        stored = await cache.get(key)
+    except Exception as e:
+        print(f"Warning: uilib data cache unavailable ({e}). Loading '{source}' without it.")
+        cache, stored = None, None
+
+    df = None
+    if stored is not None:
+        try:
+            df = pickle.loads(stored)
+        except Exception as e:
+            # e.g. stored by an older pandas after a PyScript upgrade; drop it and reload from source.
+            print(f"Warning: uilib could not read cached '{source}' ({e}). Reloading it.")
+            await _try_cache(cache.delete(key))
+    if df is None:
+        if loader is None:
+            df = await _fetch_csv(source)
+        else:
+            df = loader()
+            if inspect.isawaitable(df):
+                df = await df
+        if cache is not None:
+            # Caching is best effort; the data is loaded either way.
+            await _try_cache(cache.put(key, pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL), group=source))
+
+    _data_memo[key] = df
+    return df
+
+async def _try_cache(operation: Any) -> None:
+    """Awaits a cache operation, printing a warning instead of raising if it fails."""
+    try:
+        await operation
+    except Exception as e:
+        print(f"Warning: uilib data cache update failed ({e}).")
+
+async def _fetch_csv(url: str) -> Any:
+    import io
+    import pandas as pd
+    from pyodide.http import pyfetch
+    response = await pyfetch(url)
+    if not response.ok:
+        raise RuntimeError(f"Failed to fetch '{url}': HTTP {response.status}")
+    return pd.read_csv(io.BytesIO(await response.bytes()))
+
+# Incrementally aggregated data
+
+class DataDelta:
+    """Describes a change to a DataSource, passed to every bound callback."""
+    __slots__ = ("start", "stop", "updated", "aggregates")
+
+    def __init__(self, start: int, stop: int, updated: Any, aggregates: dict):
+        self.start = start # First appended row
+        self.stop = stop # One past the last appended row; equal to start if none were appended
+        self.updated = updated # Indices of rows changed in place
+        self.aggregates = aggregates # {aggregate name: {group: new value, or None if the group is now empty}}
+
+class Aggregate:
+    """A group-by aggregate over a DataSource column that is maintained as rows change."""
+    __slots__ = ("source", "by", "column", "func", "_sums", "_counts", "_extremes")
+    FUNCS = ("sum", "count", "mean", "min", "max")
+
+    def __init__(self, source: 'DataSource', by: str, column: str, func: str):
+        if func not in self.FUNCS:
+            raise ValueError(f"Unknown aggregate function '{func}'. Use one of {', '.join(self.FUNCS)}.")
+        self.source = source
+        self.by = by
+        self.column = column
+        self.func = func
+        self._sums = {}
+        self._counts = {}
+        self._extremes = {} # Group minima or maxima, for "min" and "max"
+
+    @property
+    def result(self) -> dict:
+        """The current aggregate value of every group."""
+        return {group: self.value(group) for group in self._counts}
+
+    def value(self, group: Any) -> Any:
+        """Returns the current aggregate value of a group, or None if the group is empty."""
+        if group not in self._counts:
+            return None
+        if self.func == "count":
+            return self._counts[group]
+        if self.func == "sum":
+            return self._sums[group]
+        if self.func == "mean":
+            return self._sums[group] / self._counts[group]
+        return self._extremes[group]
+
+    def _add(self, rows: Any) -> set:
+        """Folds the given rows into the aggregate and returns the groups that changed."""
+        if len(rows) == 0:
+            return set()
+        groups, inverse = np.unique(self.source[self.by][rows], return_inverse=True)
+        groups = groups.tolist()
+        counts = np.bincount(inverse, minlength=len(groups))
+        values = self.source[self.column][rows]
+        if self.func in ("sum", "mean"):
+            sums = np.bincount(inverse, weights=values.astype(float), minlength=len(groups))
+        elif self.func in ("min", "max"):
+            extremes = np.full(len(groups), np.inf if self.func == "min" else -np.inf)
+            (np.minimum if self.func == "min" else np.maximum).at(extremes, inverse, values.astype(float))
+            better = min if self.func == "min" else max
+        for i, group in enumerate(groups):
+            self._counts[group] = self._counts.get(group, 0) + int(counts[i])
+            if self.func in ("sum", "mean"):
+                self._sums[group] = self._sums.get(group, 0.0) + float(sums[i])
+            elif self.func in ("min", "max"):
+                if group not in self._extremes:
+                    self._extremes[group] = float(extremes[i])
+                elif self._extremes[group] is not None: # None means stale; it is recomputed later
+                    self._extremes[group] = better(self._extremes[group], float(extremes[i]))
+        return set(groups)
+
+    def _remove(self, rows: Any) -> set:
+        """Takes the given rows out of the aggregate and returns the groups that changed."""
+        if len(rows) == 0:
+            return set()
+        groups, inverse = np.unique(self.source[self.by][rows], return_inverse=True)
+        groups = groups.tolist()
+        counts = np.bincount(inverse, minlength=len(groups))
+        if self.func in ("sum", "mean"):
+            sums = np.bincount(inverse, weights=self.source[self.column][rows].astype(float), minlength=len(groups))
+        for i, group in enumerate(groups):
+            self._counts[group] -= int(counts[i])
+            if self.func in ("sum", "mean"):
+                self._sums[group] -= float(sums[i])
+            if self._counts[group] <= 0:
+                del self._counts[group]
+                self._sums.pop(group, None)
+                self._extremes.pop(group, None)
+            elif self.func in ("min", "max"):
+                # An extreme cannot be un-applied, so it is marked for recomputation.
+                self._extremes[group] = None
+        return set(groups)
+
+    def _refresh_extremes(self, changed: set) -> None:
+        """Recomputes the minimum or maximum of groups whose extreme was invalidated."""
+        stale = [g for g in changed if g in self._extremes and self._extremes[g] is None]
+        if not stale:
+            return
+        keys = self.source[self.by]
+        values = self.source[self.column]
+        for group in stale:
+            selected = values[keys == group]
+            self._extremes[group] = float(selected.min() if self.func == "min" else selected.max())
+
+class DataSource:
+    """Columnar data held in NumPy arrays, with group-by aggregates that update incrementally."""
+    def __init__(self, data: Any = None):
+        """
+        Components bind to a DataSource with `bind` and are called with a `DataDelta`
+        describing only what changed, so charts and tiles can patch themselves
+        instead of recomputing and redrawing from the full dataset.
+
+        Args:
+            data (Union[dict, pandas.DataFrame], optional): The initial data, as a DataFrame or a dict mapping column names to sequences. Defaults to None.
+        """
+        self._columns = {}
+        self._size = 0
+        self.aggregates = {}
+        self._listeners = []
+        if data is not None:
+            self.append(data)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, column: str) -> Any:
+        """Returns a read-only view of a column's values."""
+        view = self._columns[column][:self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def columns(self) -> List[str]:
+        """The names of the columns."""
+        return list(self._columns)
+
+    def to_frame(self) -> Any:
+        """Returns a copy of the data as a pandas DataFrame."""
+        import pandas as pd
+        return pd.DataFrame({name: values[:self._size].copy() for name, values in self._columns.items()})
+
+    def add_aggregate(self, name: str, by: str, column: Optional[str] = None, func: str = "sum") -> Aggregate:
+        """
+        Registers a group-by aggregate that is kept up to date as rows change.
+
+        Args:
+            name (str): The name used for the aggregate in `aggregates` and in deltas.
+            by (str): The column to group by.
+            column (str, optional): The column to aggregate. Defaults to `by`, which suits "count".
+            func (str, optional): One of "sum", "count", "mean", "min" or "max". Defaults to "sum".
+
+        Returns:
+            Aggregate: The aggregate, whose `result` holds the value of each group.
+        """
+        aggregate = Aggregate(self, by, column or by, func)
+        aggregate._add(np.arange(self._size))
+        self.aggregates[name] = aggregate
+        return aggregate
+
+    def bind(self, callback: Callable) -> Callable:
+        """Registers a callback, called as `callback(source, delta)` after every change. Returns the callback."""
+        self._listeners.append(callback)
+        return callback
+
+    def unbind(self, callback: Callable) -> None:
+        """Removes a callback registered with `bind`."""
+        self._listeners.remove(callback)
+
+    def append(self, rows: Any) -> DataDelta:
+        """
+        Appends rows, given as a DataFrame, a dict of column sequences, a dict for a single row, or a list of row dicts.
+
+        Returns:
+            DataDelta: The change that was made, as passed to bound callbacks.
+        """
+        new = self._normalise(rows)
+        if not new:
+            return self._notify(self._size, self._size, np.arange(0), {})
+        lengths = {name: len(values) for name, values in new.items()}
+        count = next(iter(lengths.values()))
+        if any(length != count for length in lengths.values()):
+            raise ValueError(f"All columns must have the same number of rows, got {lengths}.")
+        if self._columns and set(new) != set(self._columns):
+            raise ValueError(f"Rows must have exactly the columns {self.columns}, got {sorted(new)}.")
+        new = {name: self._prepare(name, values) for name, values in new.items()}
+        start = self._size
+        for name, values in new.items():
+            self._store(name, start, values)
+        self._size += count
+        rows_added = np.arange(start, self._size)
+        changed = {name: aggregate._add(rows_added) for name, aggregate in self.aggregates.items()}
+        return self._notify(start, self._size, np.arange(0), changed)
+
+    def update(self, index: Any, values: dict) -> DataDelta:
+        """
+        Changes values of existing rows in place.
+
+        Args:
+            index (Union[int, array-like]): The row index or indices to change. If an index is repeated, its last value is used.
+            values (dict): Maps column names to the new value(s) for those rows.
+
+        Returns:
+            DataDelta: The change that was made, as passed to bound callbacks.
+        """
+        index = np.atleast_1d(np.asarray(index, dtype=np.int64))
+        if len(index) and (index.min() < 0 or index.max() >= self._size):
+            raise IndexError(f"Row index out of range for DataSource of {self._size} rows.")
+        # Validate everything before changing any state, so a bad call leaves the data and aggregates intact.
+        unknown = [name for name in values if name not in self._columns]
+        if unknown:
+            raise KeyError(f"Unknown column(s) {unknown}.")
+        new_columns = {name: self._prepare(name, np.broadcast_to(np.asarray(new_values), index.shape)) for name, new_values in values.items()}
+        # A repeated row must be taken out of and put into the aggregates only once.
+        last = len(index) - 1 - np.unique(index[::-1], return_index=True)[1]
+        if len(last) < len(index):
+            index = index[last]
+            new_columns = {name: new_values[last] for name, new_values in new_columns.items()}
+        # Only aggregates that read one of the changed columns need touching.
+        affected = {name: a for name, a in self.aggregates.items() if a.by in values or a.column in values}
+        changed = {name: a._remove(index) for name, a in affected.items()}
+        for name, new_values in new_columns.items():
+            self._store(name, index, new_values)
+        for name, a in affected.items():
+            changed[name] |= a._add(index)
+        return self._notify(self._size, self._size, index, changed)
+
+    def _notify(self, start: int, stop: int, updated: Any, changed: dict) -> DataDelta:
+        for name, groups in changed.items():
+            self.aggregates[name]._refresh_extremes(groups)
+        delta = DataDelta(start, stop, updated, {
+            name: {group: self.aggregates[name].value(group) for group in groups} for name, groups in changed.items()
+        })
+        for callback in list(self._listeners):
+            callback(self, delta)
+        return delta
+
+    def _prepare(self, name: str, values: Any) -> Any:
+        """Converts new values for a column, raising if storing them would corrupt the column or its aggregates."""
+        values = np.asarray(values)
+        if values.dtype.kind in "US":
+            values = values.astype(object) # Fixed-width strings would truncate longer values later
+        column = self._columns.get(name)
+        if column is not None and column.dtype.kind != "O" and not np.can_cast(values.dtype, column.dtype, casting="same_kind"):
+            if np.result_type(column.dtype, values.dtype).kind == "O":
+                raise TypeError(f"Column '{name}' holds {column.dtype} values and cannot store {values.dtype} values.")
+        for aggregate in self.aggregates.values():
+            if aggregate.column == name and aggregate.func != "count":
+                try:
+                    values.astype(float)
+                except (TypeError, ValueError):
+                    raise TypeError(f"Column '{name}' has a '{aggregate.func}' aggregate and needs numeric values.") from None
+        return values
+
+    def _store(self, name: str, where: Any, values: Any) -> None:
+        """Writes values checked by _prepare into a column at a start offset (appending) or at given indices, growing storage as needed."""
+        column = self._columns.get(name)
+        if column is None:
+            column = np.empty(max(16, len(values)), dtype=values.dtype)
+        elif not np.can_cast(values.dtype, column.dtype, casting="same_kind"):
+            column = column.astype(np.result_type(column.dtype, values.dtype))
+        if isinstance(where, int):
+            needed = where + len(values)
+            if needed > len(column):
+                # Grow geometrically so that appends are amortised O(1) per row.
+                grown = np.empty(max(needed, 2 * len(column)), dtype=column.dtype)
+                grown[:self._size] = column[:self._size]
+                column = grown
+            column[where:needed] = values
+        else:
+            column[where] = values
+        self._columns[name] = column
+
+    @staticmethod
+    def _normalise(rows: Any) -> dict:
+        """Converts the accepted row formats to a dict of equal-length column sequences."""
+        if hasattr(rows, "to_dict") and hasattr(rows, "columns"):
+            return {name: rows[name].to_numpy() for name in rows.columns}
+        if isinstance(rows, dict):
+            if all(hasattr(v, "__len__") and not isinstance(v, str) for v in rows.values()):
+                return dict(rows)
+            return {name: [value] for name, value in rows.items()} # A single row
+        rows = list(rows)
+        if not rows:
+            return {}
+        return {name: [row[name] for row in rows] for name in rows[0]}
+
+# Cross-filtering
+
+class CrossFilter:
+    """Coordinates linked charts and tables that filter one dataset, sharing boolean masks between them."""
+    def __init__(self, data: Any):
+        """
+        Each filter is held as a NumPy boolean mask over the rows. When a filter
+        changes, the combined mask is computed once and shared by every bound view.
+        As in crossfilter-style dashboards, a view that owns a filter (e.g. the chart
+        the user is brushing) sees every filter except its own, so it is not
+        recomputed when only its own filter changes.
+
+        Args:
+            data (Union[pandas.DataFrame, dict]): The dataset, as a DataFrame or a dict mapping column names to arrays.
+        """
+        if hasattr(data, "columns") and hasattr(data, "to_numpy"):
+            self._columns = {name: data[name].to_numpy() for name in data.columns}
+        else:
+            self._columns = {name: np.asarray(values) for name, values in data.items()}
+        self._size = len(next(iter(self._columns.values()))) if self._columns else 0
+        self.filters = {} # {dimension: boolean mask}
+        self._views = [] # [(callback, owned dimension or None)]
+        self._codes = {} # {dimension: (categories, integer code per row)}
+        self._masks = {} # Combined masks for the current filters, keyed by the dimension left out
+
+    def __len__(self) -> int:
+        return self._size
+
+    def column(self, name: str) -> Any:
+        """Returns the full, unfiltered values of a column."""
+        return self._columns[name]
+
+    def bind(self, callback: Callable, owns: Optional[str] = None) -> Callable:
+        """
+        Registers a view, called as `callback(mask)` with the boolean row mask it should show.
+
+        Args:
+            callback (Callable): The function that redraws the view.
+            owns (str, optional): The dimension this view filters, if any. Its own filter is not applied to it. Defaults to None.
+
+        Returns:
+            Callable: The callback.
+        """
+        self._views.append((callback, owns))
+        return callback
+
+    def unbind(self, callback: Callable) -> None:
+        """Removes a view registered with `bind`."""
+        self._views = [view for view in self._views if view[0] is not callback]
+
+    def set_filter(self, dimension: str, values: Optional[Iterable] = None, range: Optional[tuple] = None, predicate: Optional[Callable] = None) -> None:
+        """
+        Sets the filter on a dimension and updates the affected views.
+
+        Give exactly one of `values`, `range` or `predicate`.
+
+        Args:
+            dimension (str): The column to filter on.
+            values (Iterable, optional): Keep rows whose value is one of these.
+            range (tuple, optional): Keep rows with `low <= value <= high`.
+            predicate (Callable, optional): A function taking the column array and returning a boolean mask.
+        """
+        if sum(arg is not None for arg in (values, range, predicate)) != 1:
+            raise ValueError("set_filter needs exactly one of values, range or predicate.")
+        column = self._columns[dimension]
+        if values is not None:
+            # Matching on category codes is much faster than np.isin over the raw values.
+            categories, codes = self._factorize(dimension)
+            mask = np.isin(categories, list(values))[codes]
+        elif range is not None:
+            low, high = range
+            mask = (column >= low) & (column <= high)
+        else:
+            mask = np.asarray(predicate(column), dtype=bool)
+        self.filters[dimension] = mask
+        self._changed(dimension)
+
+    def clear_filter(self, dimension: str) -> None:
+        """Removes the filter on a dimension, if any, and updates the affected views."""
+        if self.filters.pop(dimension, None) is not None:
+            self._changed(dimension)
+
+    def mask(self, exclude: Optional[str] = None) -> Any:
+        """Returns the combined mask of all filters, optionally leaving out one dimension's filter."""
+        if exclude not in self.filters:
+            exclude = None # Leaving out a filter that is not set changes nothing
+        mask = self._masks.get(exclude)
+        if mask is None:
+            masks = [m for dimension, m in self.filters.items() if dimension != exclude]
+            mask = np.logical_and.reduce(masks) if masks else np.ones(self._size, dtype=bool)
+            self._masks[exclude] = mask
+        return mask
+
+    def group(self, by: str, mask: Any, column: Optional[str] = None, func: str = "count") -> dict:
+        """
+        Aggregates the rows selected by `mask`, grouped by a dimension.
+
+        Args:
+            by (str): The column to group by.
+            mask (numpy.ndarray): The boolean row mask, typically the one passed to a view.
+            column (str, optional): The column to aggregate; not needed for "count". Defaults to None.
+            func (str, optional): One of "count", "sum" or "mean". Defaults to "count".
+
+        Returns:
+            dict: Maps every category of `by` (including those with no selected rows) to its value.
+        """
+        categories, codes = self._factorize(by)
+        selected = codes[mask]
+        counts = np.bincount(selected, minlength=len(categories))
+        if func == "count":
+            values = counts
+        elif func in ("sum", "mean"):
+            values = np.bincount(selected, weights=self._columns[column][mask].astype(float), minlength=len(categories))
+            if func == "mean":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    values = values / counts
+        else:
+            raise ValueError(f"Unknown group function '{func}'. Use 'count', 'sum' or 'mean'.")
+        return dict(zip(categories.tolist(), values.tolist()))
+
+    def refresh(self) -> None:
+        """Calls every view with its current mask, e.g. to draw them for the first time."""
+        for callback, owns in list(self._views):
+            callback(self.mask(exclude=owns))
+
+    def _changed(self, dimension: str) -> None:
+        self._masks = {}
+        for callback, owns in list(self._views):
+            if owns == dimension:
+                continue # A view does not apply its own filter, so what it shows has not changed
+            callback(self.mask(exclude=owns))
+
+    def _factorize(self, dimension: str) -> tuple:
+        """Returns the sorted categories of a column and each row's index into them, computed once."""
+        if dimension not in self._codes:
+            self._codes[dimension] = np.unique(self._columns[dimension], return_inverse=True)
+        return self._codes[dimension]